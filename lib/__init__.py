@@ -2,7 +2,10 @@
 
 import sys
 
+__version__ = '0.1.0'
+
 from cp437 import ansi
+from cp437 import codec
 from cp437 import vt100
 
 DEBUG_NONE = 0
@@ -11,37 +14,81 @@ DEBUG_EVENT = 2
 DEBUG_STATE = 3
 DEBUG = DEBUG_NONE
 
+# how our debug levels map onto the logging module: INFO, DEBUG and something chattier
+# than DEBUG. logging itself only gets imported once there's something to log.
+LOGGING_LEVELS = {DEBUG_INFO: 20,
+                  DEBUG_EVENT: 10,
+                  DEBUG_STATE: 5}
+
+logger = None
+
+def get_logger():
+    global logger
+
+    if logger is None:
+        import logging
+
+        logger = logging.getLogger('cp437')
+
+    return logger
+
+class DebugMessage(object):
+    # the message only gets formatted if a handler actually emits it
+    def __init__(self, message, args):
+        self.message = message
+        self.args = args
+
+    def __str__(self):
+        return self.message.format(*self.args)
+
+class DebugFormatter(object):
+    LEVELS = {LOGGING_LEVELS[DEBUG_INFO]: '\x1b[1;34mINFO\x1b[0m',
+              LOGGING_LEVELS[DEBUG_EVENT]: '\x1b[1;32mEVENT\x1b[0m',
+              LOGGING_LEVELS[DEBUG_STATE]: '\x1b[1;31mSTATE\x1b[0m'}
+
+    def format(self, record):
+        return '[{}] {}'.format(self.LEVELS.get(record.levelno, record.levelname), record.getMessage())
+
 def debug_level(level):
     global DEBUG
     
-    if not 0 < level < 4:
+    if not 0 <= level < 4:
         raise ValueError('debug level must be cp437.DEBUG_NONE, cp437.DEBUG_INFO, cp437.DEBUG_EVENT or cp437.DEBUG_STATE')
 
     DEBUG = level
 
-def debug(level, message, *args):
-    global DEBUG
-    
-    if debug == DEBUG_NONE:
+    if level == DEBUG_NONE:
         return
 
-    if not DEBUG >= level:
-        return
+    import logging
 
-    levels = {DEBUG_INFO: '\x1b[1;34mINFO\x1b[0m',
-              DEBUG_EVENT: '\x1b[1;32mEVENT\x1b[0m',
-              DEBUG_STATE: '\x1b[1;31mSTATE\x1b[0m'}
+    log = get_logger()
+    log.setLevel(LOGGING_LEVELS[level])
+
+    # nobody configured logging for us, so do what we always did and write to stderr
+    if not log.handlers and not logging.getLogger().handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(DebugFormatter())
+        log.addHandler(handler)
+
+def debug(level, message, *args):
+    # hot paths check cp437.DEBUG themselves before calling in here, this keeps
+    # everybody else cheap when debugging is off
+    if level > DEBUG:
+        return
 
-    sys.stderr.write('[{}] {}\n'.format(levels[level], message.format(*args)))
-    sys.stderr.flush()
+    get_logger().log(LOGGING_LEVELS[level], DebugMessage(message, args))
 
 def debug_info(message, *args):
-    return debug(DEBUG_INFO, message, *args)
+    if DEBUG >= DEBUG_INFO:
+        debug(DEBUG_INFO, message, *args)
 
 def debug_event(message, *args):
-    return debug(DEBUG_EVENT, message, *args)
+    if DEBUG >= DEBUG_EVENT:
+        debug(DEBUG_EVENT, message, *args)
 
 def debug_state(message, *args):
-    return debug(DEBUG_STATE, message, *args)
+    if DEBUG >= DEBUG_STATE:
+        debug(DEBUG_STATE, message, *args)
 
-__all__ = ['ansi', 'vt100']
+__all__ = ['ansi', 'batch', 'cache', 'codec', 'irc', 'raster', 'vt100']
@@ -1,5 +1,8 @@
 #!/usr/bin/env python
 
+import array
+import codecs
+
 colors = {
     0: (0,0,0),
     1: (170,0,0),
@@ -315,4355 +318,105 @@ utf8 = {
     255: 0x00A0
 }
 
-charset = {
-     0: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-     1: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 0, 0, 0, 0, 0, 0, 1, 0]
-        ,[1, 0, 1, 0, 0, 1, 0, 1, 0]
-        ,[1, 0, 0, 0, 0, 0, 0, 1, 0]
-        ,[1, 0, 0, 0, 0, 0, 0, 1, 0]
-        ,[1, 0, 1, 1, 1, 1, 0, 1, 0]
-        ,[1, 0, 0, 1, 1, 0, 0, 1, 0]
-        ,[1, 0, 0, 0, 0, 0, 0, 1, 0]
-        ,[1, 0, 0, 0, 0, 0, 0, 1, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-     2: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 1, 0, 0, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-     3: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-     4: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-     5: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 1, 0, 0, 1, 1, 1, 0]
-        ,[1, 1, 1, 0, 0, 1, 1, 1, 0]
-        ,[1, 1, 1, 0, 0, 1, 1, 1, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-     6: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-     7: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-     8: [[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 1, 0, 0, 1, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 1, 0, 0, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]],
-
-     9: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 0, 0, 0, 0, 1, 0, 0]
-        ,[0, 1, 0, 0, 0, 0, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    10: [[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 0, 0, 1, 1, 0, 0, 1, 0]
-        ,[1, 0, 1, 1, 1, 1, 0, 1, 0]
-        ,[1, 0, 1, 1, 1, 1, 0, 1, 0]
-        ,[1, 0, 0, 1, 1, 0, 0, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]],
-
-    11: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    12: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    13: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 1, 1, 0]
-        ,[0, 0, 1, 1, 0, 0, 1, 1, 0]
-        ,[0, 0, 1, 1, 1, 1, 1, 1, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    14: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[0, 1, 1, 0, 0, 0, 1, 1, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[0, 1, 1, 0, 0, 0, 1, 1, 0]
-        ,[0, 1, 1, 0, 0, 0, 1, 1, 0]
-        ,[0, 1, 1, 0, 0, 0, 1, 1, 0]
-        ,[0, 1, 1, 0, 0, 0, 1, 1, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 1, 0]
-        ,[1, 1, 1, 0, 0, 1, 1, 1, 0]
-        ,[1, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    15: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 1, 0, 0, 1, 1, 1, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    16: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    17: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    18: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    19: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    20: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[0, 1, 1, 1, 1, 0, 1, 1, 0]
-        ,[0, 0, 0, 1, 1, 0, 1, 1, 0]
-        ,[0, 0, 0, 1, 1, 0, 1, 1, 0]
-        ,[0, 0, 0, 1, 1, 0, 1, 1, 0]
-        ,[0, 0, 0, 1, 1, 0, 1, 1, 0]
-        ,[0, 0, 0, 1, 1, 0, 1, 1, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    21: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    22: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    23: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    24: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    25: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    26: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    27: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    28: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    29: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 0, 0, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 0, 0, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    30: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    31: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    32: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    33: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    34: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 0, 0, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    35: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    36: [[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    37: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    38: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    39: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    40: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    41: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    42: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    43: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    44: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    45: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    46: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    47: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    48: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    49: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    50: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    51: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    52: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    53: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    54: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    55: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    56: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    57: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    58: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    59: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    60: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    61: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    62: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    63: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    64: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    65: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    66: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    67: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    68: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    69: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 1, 0, 0]
-        ,[0, 1, 1, 0, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    70: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 1, 0, 0]
-        ,[0, 1, 1, 0, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    71: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    72: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    73: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    74: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    75: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    76: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    77: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 1, 0, 0, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    78: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    79: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    80: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    81: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 1, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 1, 1, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    82: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    83: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    84: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[1, 0, 0, 1, 1, 0, 0, 1, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    85: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    86: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    87: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    88: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    89: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    90: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    91: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    92: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    93: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    94: [[0, 0, 0, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    95: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    96: [[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    97: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    98: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-    99: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   100: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   101: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   102: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   103: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   104: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   105: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   106: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   107: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   108: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   109: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   110: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   111: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   112: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   113: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   114: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   115: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   116: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   117: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   118: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   119: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   120: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   121: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   122: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   123: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   124: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   125: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   126: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   127: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   128: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   129: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   130: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   131: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   132: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   133: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   134: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   135: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   136: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   137: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   138: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   139: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   140: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   141: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   142: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   143: [[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   144: [[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   145: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 1, 1, 0]
-        ,[0, 0, 0, 1, 1, 0, 1, 1, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 1, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   146: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   147: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   148: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   149: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   150: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   151: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   152: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   153: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   154: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   155: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   156: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   157: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 1, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   158: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 1, 1, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 1, 1, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   159: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 1, 1, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   160: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   161: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   162: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   163: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   164: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   165: [[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   166: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   167: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   168: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   169: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   170: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   171: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 1, 0, 0]
-        ,[1, 0, 0, 1, 1, 0, 1, 1, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 1, 1, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   172: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 1, 0, 0]
-        ,[1, 0, 0, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   173: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   174: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   175: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   176: [[0, 0, 0, 1, 0, 0, 0, 1, 1]
-        ,[0, 1, 0, 0, 0, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 0, 0, 0, 1, 1]
-        ,[0, 1, 0, 0, 0, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 0, 0, 0, 1, 1]
-        ,[0, 1, 0, 0, 0, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 0, 0, 0, 1, 1]
-        ,[0, 1, 0, 0, 0, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 0, 0, 0, 1, 1]
-        ,[0, 1, 0, 0, 0, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 0, 0, 0, 1, 1]
-        ,[0, 1, 0, 0, 0, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 0, 0, 0, 1, 1]
-        ,[0, 1, 0, 0, 0, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 0, 0, 0, 1, 1]
-        ,[0, 1, 0, 0, 0, 1, 0, 0, 0]],
-
-   177: [[0, 1, 0, 1, 0, 1, 0, 1, 1]
-        ,[1, 0, 1, 0, 1, 0, 1, 0, 0]
-        ,[0, 1, 0, 1, 0, 1, 0, 1, 1]
-        ,[1, 0, 1, 0, 1, 0, 1, 0, 0]
-        ,[0, 1, 0, 1, 0, 1, 0, 1, 1]
-        ,[1, 0, 1, 0, 1, 0, 1, 0, 0]
-        ,[0, 1, 0, 1, 0, 1, 0, 1, 1]
-        ,[1, 0, 1, 0, 1, 0, 1, 0, 0]
-        ,[0, 1, 0, 1, 0, 1, 0, 1, 1]
-        ,[1, 0, 1, 0, 1, 0, 1, 0, 0]
-        ,[0, 1, 0, 1, 0, 1, 0, 1, 1]
-        ,[1, 0, 1, 0, 1, 0, 1, 0, 0]
-        ,[0, 1, 0, 1, 0, 1, 0, 1, 1]
-        ,[1, 0, 1, 0, 1, 0, 1, 0, 0]
-        ,[0, 1, 0, 1, 0, 1, 0, 1, 1]
-        ,[1, 0, 1, 0, 1, 0, 1, 0, 0]],
-
-   178: [[1, 1, 0, 1, 1, 1, 0, 1, 1]
-        ,[0, 1, 1, 1, 0, 1, 1, 1, 1]
-        ,[1, 1, 0, 1, 1, 1, 0, 1, 1]
-        ,[0, 1, 1, 1, 0, 1, 1, 1, 1]
-        ,[1, 1, 0, 1, 1, 1, 0, 1, 1]
-        ,[0, 1, 1, 1, 0, 1, 1, 1, 1]
-        ,[1, 1, 0, 1, 1, 1, 0, 1, 1]
-        ,[0, 1, 1, 1, 0, 1, 1, 1, 1]
-        ,[1, 1, 0, 1, 1, 1, 0, 1, 1]
-        ,[0, 1, 1, 1, 0, 1, 1, 1, 1]
-        ,[1, 1, 0, 1, 1, 1, 0, 1, 1]
-        ,[0, 1, 1, 1, 0, 1, 1, 1, 1]
-        ,[1, 1, 0, 1, 1, 1, 0, 1, 1]
-        ,[0, 1, 1, 1, 0, 1, 1, 1, 1]
-        ,[1, 1, 0, 1, 1, 1, 0, 1, 1]
-        ,[0, 1, 1, 1, 0, 1, 1, 1, 1]],
-
-   179: [[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]],
-
-   180: [[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]],
-
-   181: [[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]],
-
-   182: [[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]],
-
-   183: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]],
-
-   184: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]],
-
-   185: [[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]],
-
-   186: [[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]],
-
-   187: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]],
-
-   188: [[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   189: [[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   190: [[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   191: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]],
-
-   192: [[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   193: [[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   194: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]],
-
-   195: [[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]],
-
-   196: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   197: [[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]],
-
-   198: [[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]],
-
-   199: [[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 1, 1]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]],
-
-   200: [[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 1, 1]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   201: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 1, 1]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]],
-
-   202: [[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 0, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   203: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 1, 1, 1, 1]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]],
-
-   204: [[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 1, 1]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 1, 1]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]],
-
-   205: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   206: [[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 0, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 1, 1, 1, 1]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]],
-
-   207: [[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   208: [[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   209: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]],
-
-   210: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]],
-
-   211: [[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   212: [[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   213: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]],
-
-   214: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]],
-
-   215: [[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 1, 1, 0, 0]],
-
-   216: [[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]],
-
-   217: [[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   218: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]],
-
-   219: [[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]],
-
-   220: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]],
-
-   221: [[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 0, 0, 0, 0, 0]],
-
-   222: [[0, 0, 0, 0, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 1, 1, 1, 1, 1]],
-
-   223: [[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   224: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   225: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   226: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   227: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   228: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   229: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   230: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   231: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   232: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   233: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   234: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 1, 0, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   235: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   236: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   237: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 1, 1, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[1, 1, 0, 1, 1, 0, 1, 1, 0]
-        ,[1, 1, 1, 1, 0, 0, 1, 1, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   238: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   239: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   240: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   241: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 1, 1, 1, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   242: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   243: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   244: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 1, 1, 0]
-        ,[0, 0, 0, 1, 1, 0, 1, 1, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]],
-
-   245: [[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 0, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   246: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 1, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   247: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 1, 1, 0, 0]
-        ,[1, 1, 0, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   248: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   249: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   250: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   251: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 1, 1, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 1, 1, 0, 0, 0]
-        ,[1, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   252: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 0, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   253: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 1, 1, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 0, 0, 0, 0, 0, 0]
-        ,[1, 1, 0, 0, 1, 0, 0, 0, 0]
-        ,[1, 1, 1, 1, 1, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   254: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 1, 1, 1, 1, 1, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]],
-
-   255: [[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]
-        ,[0, 0, 0, 0, 0, 0, 0, 0, 0]]}
+# the same table as a 256 character string, which is what the charmap codec machinery
+# wants, so whole runs of characters can be converted in a single call.
+unicode_table = u''.join(map(unichr, [utf8[c] for c in xrange(256)]))
+
+# when rendering, the null character takes up space like everything else.
+render_table = u' ' + unicode_table[1:]
+ascii_table = ' ' + ''.join(map(chr, xrange(1, 256)))
+
+def render_unicode(data):
+    return codecs.charmap_decode(bytes(data), 'strict', render_table)[0]
+
+def render_ascii(data):
+    return bytes(data).translate(ascii_table)
+
+# the VGA font: 256 glyphs of 16 rows by 9 columns. every row is packed into two bytes,
+# big endian, with the leftmost column as the highest of the 9 bits. the whole thing is
+# compressed and only gets unpacked the first time somebody actually needs a glyph.
+FONT = (
+    'eNqdGT1rI1dw5gip9ANUmMSQNoU4gnFh4vZInR+gIqQyWEUIyyHOJgiRQkVKF/4HSaHKCOJiiyOk'
+    'WI4rVRxB1VUipypssdg373PfmzfvrS9vWK2k2TdvvmfeW4AnjA6f4Xd0PcOX+FzdoWP4B7yj6wGX'
+    '+EbdGV6NLXYGoIUZHCf4Y/q3zWInUEFFtAnou/qV4ju7soQPqNBnMDTXDt4Q/1YCB8GjFTSwIGhC'
+    '6sGzS9LNS62hJZt/BkfwDfwAB7wxAIeIL0XZgOLOSBCOV/AjXVMLO9xhHeEf4C99GVBaavCaST7B'
+    'O6VBuu5i+gh4jTXRPJB1Doo2/Q7nfgYj4v8M5mSduZZlRP8l2tdUFfdMwzSaCMB+BvyT9xDAf3Di'
+    'oR8trqAmr9jiir5t6duY7q3sqt7Lyvzl8Q6Y9gKQJDRPjWndsYhTYwo14Wu6ZwbpXUGXQb+Ahvyp'
+    'obs0VPxQBKkYkijYyGv1U8fwacPETeU1E+vHWPVFkcJWxb/69PdQt2RhXJDHtuRZIxxp6zIbEH6l'
+    'dau0uMJRRH2mKc5gjxsbX/tI7wrqAneGbg9kSWY59U8PE9GGFL1kn4r5duxFaWzLz8krQNY3Ugp8'
+    'qCh2+ovjW+cfnflUFNI9znCa3owyVhwDwCI0pL5CCT8iqiNtYR69Yzgl3JYs11kNnzHfNZHRZubP'
+    '9KqEVxlCZ4mWzTfrh3Zm/JlZ8nyP78z6ROdQ0Pkkkx1CPLeu1571tZFUhYNPPvp5jk7Cv8ZI8dtL'
+    'eK9hoyOR5xadfZUmrS5C/bY2B7h7g23iXwtrw2tccP/CA0VvWCG2eGBe38BreEtaf0uSvSZqXQFP'
+    'gLvM+vea9wZ+iuZbmXrpYvl85ushjo+zPjdI9R2tVPSvlRSjHEHc1gGk8rmeREenAcZ/g3vi/h5v'
+    'Rf7bXi4xPnr71aL+4vl/4D09OaY+IJ1v7RjLZ/1P1fCxit5kfSXZ87x+OffJ/GUItouS8SrDPfD+'
+    'I5g1cbkwne+fSPlTvV+f/35R/R/znykD1p+aHgx2pKFTob+qouqjoOKxCZ88LI+m3j1lHGjdVqiv'
+    'gMZrwiiWujPlBSYD8Px6amXa+v54n5nfifNV/f9be63sv2bsHXWi36pIdVFq+d/Sqo3ovyZfzrLx'
+    'P9L5+shWBwNNn+Us/SADMPqzgfxiswjaPln3yil+w7psEHO8VN/S+a2gRaa/pEpvtP7y+nd9fNq9'
+    'HysvpCziouOCPCLl7yZYX/CPfPxHeJcBBLydqTOAgA/zj+oExrxKEV+uP42r9JG16s7b90jcX0Bm'
+    '/7HzsyaeUmyZzWD09jV8lXSRYX021Vl1Em2v+aL+XT+ci0+9cjF/3BTzS20zVA4/071/gb7fY5so'
+    'NNJVCX/Z/GKzaw7v+MvnpyaJ8ortrpoC3tHP4DV3SYeWaCeHt92i7qFq2wE04j7jHfxM+/IO1+Rt'
+    '/0aYuc3cnfeQW8H+2fwT6FfCh/qV8FN1rlLwTzs/nz/M+ml8m/qgsW2+/1D4Yn+i90uUeUx8LZM9'
+    'YFq9WP/sMhPlLX2x85vWZmzqG+EfW7/eR9nnxO/avAfh2ucQt1/IxY+L77z/mvltVn7jYfn8rfNX'
+    'pn4ZXNLhRpGtdv/z7N7InQ5A7szI7genfveaOV3y+9Dr3NmTr/78VGdBVF11uMUT7V3fiviG8F+T'
+    'NCGVsDZU6RmmHRcUhWuS9CLDncGpZ8LxFfxavH7H70sX/gkfSlfS2RQBD2WcgL8IAffxb64LslAW'
+    'P0SfaI8E+kMQeUdpvqbfCVYNn+kyp0W9fso9/2HAAud5+nqNxwH6j4P0J4VzVhDo8/XLtM/L/gGX'
+    'BUtdUvRdFYS7InxhPn4Q+Y9ko2fK618W/OdRpB+vn9KPbFear2kM8f84aL9yNFwV7Hsu+l8/zof9'
+    'h+gX1xf4i3xryH+H4ivlDx/LwPWXwK4M8GUZSqsl++MN9XZr3d/F9dm9t1rTZSr8DT9f9Xv7TIV0'
+    'p/8eIDmhNX2atH9ybxnXDmAnnL7He9frVLqC33S2C+/fwSU9RN89224ixa6cdPiOnQ+a09l58J5P'
+    'ks/s7CXZP6duwODfE55Ld6o7rNqf302T/XN6Aii+WQg/S28v2PkWsNPntBOLT7c5/ki/8Xtah5Cz'
+    'v+Gsy56/u11yulfu+8P/92aFP8HHF8HpsPGPKrSP7svEqHC7f3pCRcVvxezTRvDk8RHmx8WM')
+
+GLYPH_WIDTH = 9
+GLYPH_HEIGHT = 16
+
+font = None
+
+def get_font():
+    global font
+
+    if font is None:
+        import base64
+        import struct
+        import zlib
+
+        font = array.array('H', struct.unpack('>{}H'.format(256*GLYPH_HEIGHT), zlib.decompress(base64.b64decode(FONT))))
+
+    return font
+
+def glyph_rows(c):
+    # the rows of a glyph as 9 bit integers
+    return get_font()[c*GLYPH_HEIGHT:(c+1)*GLYPH_HEIGHT]
+
+class Charset(object):
+    # glyphs as lists of rows of pixels, e.g. charset[c][y][x], built when first asked for
+    def __init__(self):
+        self.glyphs = dict()
+
+    def __getitem__(self, c):
+        if not 0 <= c < 256:
+            raise KeyError(c)
+
+        if not c in self.glyphs:
+            self.glyphs[c] = [[row >> (GLYPH_WIDTH-1-x) & 1 for x in xrange(GLYPH_WIDTH)] for row in glyph_rows(c)]
+
+        return self.glyphs[c]
+
+    def __contains__(self, c):
+        return 0 <= c < 256
+
+    def __len__(self):
+        return 256
+
+    def __iter__(self):
+        return iter(xrange(256))
+
+    def keys(self):
+        return range(256)
+
+    def values(self):
+        return [self[c] for c in xrange(256)]
+
+    def items(self):
+        return [(c, self[c]) for c in xrange(256)]
+
+charset = Charset()
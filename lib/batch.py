@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+
+import multiprocessing
+import os
+import sys
+import time
+
+import cp437
+from cp437 import cache, vt100
+
+# what gets picked up when walking a directory. files named on their own are always rendered.
+EXTENSIONS = ('.ans', '.asc', '.diz', '.ice', '.nfo', '.txt')
+
+class BatchResult(object):
+    def __init__(self, filename, output, elapsed, error=None):
+        self.filename = filename
+        self.output = output
+        self.elapsed = elapsed
+        self.error = error
+
+    @property
+    def failed(self):
+        return not self.error is None
+
+    def __repr__(self):
+        return '<BatchResult: {} {:.3f}s{}>'.format(self.filename, self.elapsed, ' failed' if self.failed else '')
+
+def read_manifest(manifest):
+    # one filename per line, blank lines and #comments are skipped. - reads it from stdin.
+    if manifest == '-':
+        fp = sys.stdin
+    else:
+        fp = open(manifest, 'rb')
+
+    try:
+        lines = [line.strip() for line in fp]
+    finally:
+        if not fp is sys.stdin:
+            fp.close()
+
+    return [line for line in lines if line and not line.startswith('#')]
+
+def common_parent(paths):
+    # the deepest directory all of paths are in, a directory counting as in its parent
+    parents = [os.path.dirname(os.path.abspath(path)).split(os.sep) for path in paths]
+
+    return os.sep.join(os.path.commonprefix(parents)) or os.sep
+
+def find_files(paths, extensions=None):
+    # (filename, name relative to where it was found) for every file to render.
+    # directories are walked for files ending in one of extensions, files named on their
+    # own are always rendered. everything is named relative to the directory all the paths
+    # have in common, so pack1/file.ans and pack2/file.ans stay apart either way.
+    extensions = tuple(extensions or EXTENSIONS)
+    directories = [path for path in paths if os.path.isdir(path)]
+    filenames = [path for path in paths if not os.path.isdir(path)]
+
+    if not paths:
+        return
+
+    common = common_parent(paths)
+
+    for path in filenames:
+        yield path, os.path.relpath(os.path.abspath(path), common)
+
+    for path in directories:
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+
+            for filename in sorted(files):
+                if not filename.lower().endswith(extensions):
+                    continue
+
+                filename = os.path.join(root, filename)
+
+                yield filename, os.path.relpath(os.path.abspath(filename), common)
+
+def render_to(data, fp, options):
+    # parse data and write it to fp as a PNG or as text, depending on options
+    if options.get('irc', False):
+        from cp437 import irc
+
+        data = irc.translate(data)
+
+    parser = vt100.VT100Parser(stream=data)
+    screen = vt100.VT100Screen(width=options.get('width', vt100.VT100Screen.WIDTH)
+                               ,height=options.get('height', vt100.VT100Screen.HEIGHT)
+                               ,linebuffer=options.get('linebuffer', vt100.VT100Screen.LINEBUFFER)
+                               ,spacing=options.get('spacing', vt100.VT100Screen.SPACING)
+                               ,nfo=options.get('nfo', vt100.VT100Screen.NFO))
+
+    parser.parse(screen)
+
+    if options.get('text', False):
+        screen.dump_to(fp, options.get('colors', True), options.get('utf8', True), options.get('encoding', 'utf8'))
+    else:
+        screen.dump_png(fp
+                        ,compression=options.get('compression', None)
+                        ,strategy=options.get('strategy', None)
+                        ,workers=options.get('workers', None))
+
+def output_options(options):
+    # just the options that change what render_to writes, with the defaults filled in, so
+    # the same render gets the same cache key no matter who asks for it or how
+    text = options.get('text', False)
+    result = {'width': options.get('width', vt100.VT100Screen.WIDTH),
+              'linebuffer': options.get('linebuffer', vt100.VT100Screen.LINEBUFFER),
+              'nfo': bool(options.get('nfo', vt100.VT100Screen.NFO)),
+              'irc': bool(options.get('irc', False)),
+              'text': bool(text)}
+
+    if text:
+        result.update(colors=bool(options.get('colors', True)),
+                      utf8=bool(options.get('utf8', True)),
+                      encoding=options.get('encoding', 'utf8'))
+    else:
+        from cp437 import raster
+
+        compression = options.get('compression', None)
+        strategy = options.get('strategy', None)
+
+        result.update(spacing=bool(options.get('spacing', vt100.VT100Screen.SPACING)),
+                      compression=raster.PNGWriter.COMPRESSION if compression is None else compression,
+                      strategy=raster.PNGWriter.STRATEGY if strategy is None else strategy)
+
+    return result
+
+def render(filename, output, options):
+    # render filename into output, through the render cache if options has a cache_dir
+    fp = open(filename, 'rb')
+
+    try:
+        data = fp.read()
+    finally:
+        fp.close()
+
+    # rendered to a temporary file first, so failures don't leave anything half written
+    cache_dir = options.get('cache_dir', None)
+
+    if cache_dir is None:
+        cache.write_atomically(output, lambda fp: render_to(data, fp, options))
+    else:
+        extension = '.txt' if options.get('text', False) else '.png'
+        render_cache = cache.get_render_cache(cache_dir)
+        rendered = render_cache.render(data, output_options(options), extension, lambda fp: render_to(data, fp, options))
+
+        cache.write_atomically(output, lambda fp: fp.write(rendered))
+
+def render_job(job):
+    # runs in the pool, so nothing it raises may escape and take the batch down with it
+    filename, output, options = job
+    start = time.time()
+
+    try:
+        directory = os.path.dirname(output)
+
+        if directory and not os.path.isdir(directory):
+            cache.make_directory(directory)
+
+        render(filename, output, options)
+    except Exception as e:
+        return BatchResult(filename, output, time.time()-start, '{}: {}'.format(type(e).__name__, e))
+
+    return BatchResult(filename, output, time.time()-start)
+
+def run(files, output_dir, options=None, workers=None, chunksize=8):
+    # render (filename, relative name) pairs like find_files gives out into output_dir,
+    # in a pool of workers (one per CPU by default). results come back as they finish.
+    options = options or dict()
+    extension = '.txt' if options.get('text', False) else '.png'
+    jobs = list()
+    outputs = dict()
+
+    for filename, name in files:
+        output = os.path.join(output_dir, name + extension)
+        key = os.path.normcase(os.path.abspath(output))
+
+        if key in outputs:
+            # two inputs with one output, don't let the second quietly overwrite the first
+            yield BatchResult(filename, output, 0.0, 'output {} is already rendered from {}'.format(output, outputs[key]))
+            continue
+
+        outputs[key] = filename
+        jobs.append((filename, output, options))
+
+    cp437.debug_info('rendering {} files into {}', len(jobs), output_dir)
+
+    if workers == 1:
+        for job in jobs:
+            yield render_job(job)
+
+        return
+
+    pool = multiprocessing.Pool(workers or None)
+
+    try:
+        for result in pool.imap_unordered(render_job, jobs, chunksize):
+            yield result
+
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+
+import collections
+import copy
+import errno
+import hashlib
+import os
+import StringIO
+import tempfile
+import threading
+
+import cp437
+from cp437 import vt100
+
+# files being written are named this until they're complete and renamed into place
+TEMP_PREFIX = '.tmp-'
+
+class RenderCache(object):
+    # rendered output on disk, keyed by what went into it: the input, the options it was
+    # rendered with and the library version. files are written to a temporary name and
+    # renamed into place, so any number of processes can share a directory. reading a file
+    # touches it, and once the directory grows past size the least recently used go first.
+    SIZE = 256*1024*1024
+
+    def __init__(self, directory, size=None):
+        self.directory = directory
+        self.size = size or self.SIZE
+        self.used = None
+
+        if not os.path.isdir(self.directory):
+            make_directory(self.directory)
+
+    def key(self, data, options):
+        # options is a dictionary of anything that changes the output
+        digest = hashlib.sha1(cp437.__version__)
+        digest.update(repr(sorted(options.items())))
+        digest.update(data)
+
+        return digest.hexdigest()
+
+    def path(self, key, extension):
+        return os.path.join(self.directory, key[:2], key + extension)
+
+    def get(self, key, extension):
+        path = self.path(key, extension)
+
+        try:
+            fp = open(path, 'rb')
+        except IOError as e:
+            if e.errno == errno.ENOENT:
+                return None
+
+            raise
+
+        try:
+            data = fp.read()
+        finally:
+            fp.close()
+
+        try:
+            os.utime(path, None)
+        except OSError:
+            # evicted by somebody else in the meantime, we still have the data
+            pass
+
+        cp437.debug_info('cache hit for {}{}', key, extension)
+
+        return data
+
+    def put(self, key, extension, data):
+        path = self.path(key, extension)
+        directory = os.path.dirname(path)
+
+        if not os.path.isdir(directory):
+            make_directory(directory)
+
+        # whoever else wrote this key wrote the same thing
+        write_atomically(path, lambda fp: fp.write(data), replace=False)
+
+        if self.used is None:
+            self.used = self.measure()
+        else:
+            self.used += len(data)
+
+        if self.used > self.size:
+            self.evict()
+
+    def render(self, data, options, extension, render):
+        # the cached output for data, or what render writes to the file object it's given
+        key = self.key(data, dict(options, extension=extension))
+        rendered = self.get(key, extension)
+
+        if rendered is None:
+            fp = StringIO.StringIO()
+            render(fp)
+            rendered = fp.getvalue()
+
+            self.put(key, extension, rendered)
+
+        return rendered
+
+    def entries(self):
+        # (mtime, size, path) of everything in the cache
+        for root, dirs, files in os.walk(self.directory):
+            for filename in files:
+                if filename.startswith(TEMP_PREFIX):
+                    continue
+
+                path = os.path.join(root, filename)
+
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+
+                yield stat.st_mtime, stat.st_size, path
+
+    def measure(self):
+        return sum([size for mtime, size, path in self.entries()])
+
+    def evict(self):
+        entries = sorted(self.entries())
+        self.used = sum([size for mtime, size, path in entries])
+
+        for mtime, size, path in entries:
+            if self.used <= self.size:
+                break
+
+            try:
+                os.remove(path)
+            except OSError:
+                # another process got to it first
+                pass
+
+            self.used -= size
+
+        cp437.debug_info('cache is now {} bytes', self.used)
+
+render_caches = dict()
+
+def get_render_cache(directory):
+    # one RenderCache per directory and process, so its size is only measured once
+    # instead of every time somebody renders through it
+    key = os.path.abspath(directory)
+
+    if not key in render_caches:
+        render_caches[key] = RenderCache(directory)
+
+    return render_caches[key]
+
+class ScreenCache(object):
+    # parsed screens in memory, for services that get asked for the same file over and over.
+    # screens are keyed by a hash of the input and the options that change how it parses,
+    # and the least recently used go once their draw buffers add up to more than size.
+    # it's safe to share between threads, parsing happens outside of the lock.
+    SIZE = 64*1024*1024
+
+    def __init__(self, size=None):
+        self.size = size or self.SIZE
+        self.used = 0
+        self.screens = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+    def key(self, data, width, linebuffer, palette):
+        # NFO mode lives in the palette, so its colors and nfo flag are part of the key.
+        # None is whatever palette VT100Screen picks by itself.
+        if not palette is None:
+            palette = (palette.nfo, tuple(sorted([(index, tuple(color)) for index, color in palette.palette.items()])))
+
+        return hashlib.sha1(data).digest(), width, linebuffer, palette
+
+    def get(self, data, **kwargs):
+        # a screen with data parsed onto it, kwargs are the same as VT100Screen's. height and
+        # spacing don't change parsing, so screens differing only by those are shared. what
+        # comes back shares its draw buffer with the cache: render it, but don't draw on it.
+        width = kwargs.setdefault('width', vt100.VT100Screen.WIDTH)
+        linebuffer = kwargs.setdefault('linebuffer', vt100.VT100Screen.LINEBUFFER)
+        key = self.key(data, width, linebuffer, kwargs.get('palette', None))
+
+        with self.lock:
+            entry = self.screens.pop(key, None)
+
+            if not entry is None:
+                self.screens[key] = entry
+
+        if entry is None:
+            cp437.debug_info('screen cache miss, parsing {} bytes', len(data))
+
+            screen = vt100.VT100Screen(**kwargs)
+            vt100.VT100Parser(stream=data).parse(screen)
+
+            with self.lock:
+                # another thread may have parsed the same thing in the meantime
+                entry = self.screens.pop(key, None)
+
+                if entry is None:
+                    entry = (screen, screen.memory_size())
+                    self.used += entry[1]
+
+                self.screens[key] = entry
+                self.evict()
+
+        screen = copy.copy(entry[0])
+        screen.height = kwargs.get('height', vt100.VT100Screen.HEIGHT)
+        screen.spacing = 9 if kwargs.get('spacing', vt100.VT100Screen.SPACING) else 8
+
+        return screen
+
+    def evict(self):
+        # call with the lock held. a screen bigger than the whole budget doesn't stay either
+        while self.used > self.size:
+            screen, size = self.screens.popitem(last=False)[1]
+            self.used -= size
+
+    def clear(self):
+        with self.lock:
+            self.screens.clear()
+            self.used = 0
+
+    def __len__(self):
+        return len(self.screens)
+
+def make_directory(directory):
+    try:
+        os.makedirs(directory)
+    except OSError:
+        if not os.path.isdir(directory):
+            raise
+
+def write_atomically(path, write, replace=True):
+    # call write with a file object and rename what it wrote to path once it's done, so
+    # nobody ever sees half a file and a failed write leaves nothing behind. without
+    # replace, a file somebody else put at path in the meantime is kept instead.
+    handle, temp = tempfile.mkstemp(prefix=TEMP_PREFIX, dir=os.path.dirname(path) or '.')
+    fp = os.fdopen(handle, 'wb')
+
+    try:
+        write(fp)
+        fp.close()
+
+        # mkstemp makes files only we can read, these get the usual permissions
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temp, 0666 & ~umask)
+
+        try:
+            os.rename(temp, path)
+        except OSError:
+            # windows won't rename over a file
+            if not os.path.exists(path):
+                raise
+
+            if replace:
+                os.remove(path)
+                os.rename(temp, path)
+    finally:
+        fp.close()
+
+        if os.path.exists(temp):
+            os.remove(temp)
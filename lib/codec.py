@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+
+import codecs
+
+from cp437 import ansi
+
+# the stock cp437 codec treats 0x01-0x1F and 0x7F as control characters, art treats them
+# as glyphs. this codec is built straight from our own table, so it round-trips art.
+NAMES = ('cp437-art', 'cp437_art')
+
+decoding_table = ansi.unicode_table
+encoding_table = codecs.charmap_build(decoding_table)
+encodable = frozenset(decoding_table)
+
+def best_effort(error):
+    # try to find something close enough to the characters we can't encode: what the
+    # stock codec makes of them (newlines and friends), then their decomposed forms
+    # (accented letters and the like), and if all that fails, a question mark.
+    import unicodedata
+
+    if not isinstance(error, UnicodeEncodeError):
+        raise error
+
+    replacement = list()
+
+    for character in error.object[error.start:error.end]:
+        try:
+            replacement.append(decoding_table[ord(character.encode('cp437'))])
+            continue
+        except UnicodeEncodeError:
+            pass
+
+        decomposed = [c for c in unicodedata.normalize('NFKD', character) if c in encodable]
+
+        if decomposed and not unicodedata.combining(decomposed[0]):
+            replacement.append(u''.join(decomposed))
+        else:
+            replacement.append(u'?')
+
+    return u''.join(replacement), error.end
+
+codecs.register_error('cp437-art-best-effort', best_effort)
+
+def error_handler(errors):
+    if errors == 'best-effort':
+        return 'cp437-art-best-effort'
+
+    return errors
+
+class Codec(codecs.Codec):
+    def encode(self, input, errors='strict'):
+        return codecs.charmap_encode(input, error_handler(errors), encoding_table)
+
+    def decode(self, input, errors='strict'):
+        return codecs.charmap_decode(input, errors, decoding_table)
+
+class IncrementalEncoder(codecs.IncrementalEncoder):
+    def encode(self, input, final=False):
+        return codecs.charmap_encode(input, error_handler(self.errors), encoding_table)[0]
+
+class IncrementalDecoder(codecs.IncrementalDecoder):
+    def decode(self, input, final=False):
+        return codecs.charmap_decode(input, self.errors, decoding_table)[0]
+
+class StreamWriter(Codec, codecs.StreamWriter):
+    pass
+
+class StreamReader(Codec, codecs.StreamReader):
+    pass
+
+def search(name):
+    if not name in NAMES:
+        return None
+
+    return codecs.CodecInfo(name=NAMES[0]
+                            ,encode=Codec().encode
+                            ,decode=Codec().decode
+                            ,incrementalencoder=IncrementalEncoder
+                            ,incrementaldecoder=IncrementalDecoder
+                            ,streamwriter=StreamWriter
+                            ,streamreader=StreamReader)
+
+codecs.register(search)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+import re
+
+from cp437 import ansi
+
+class IRCTranslator(object):
+    # turns mIRC formatting codes into VT100 color sequences in a single pass. it can be fed
+    # chunks of a stream, and holds back anything that could be the start of a color code.
+    CODES = re.compile('\x03(?:([0-9]{1,2})(?:,([0-9]{1,2}))?)?|[\x02\x0f\x16]')
+    BOLD = '\x02'
+    COLOR = '\x03'
+    RESET = '\x0f'
+    REVERSE = '\x16'
+    DEFAULT = 99 # mIRC's "whatever the client uses"
+    FG = 7
+    BG = 0
+
+    # the longest color code is \x03FG,BG
+    HOLDBACK = 5
+
+    def __init__(self):
+        self.pending = ''
+        self.reset()
+
+    def reset(self):
+        self.fg = self.FG
+        self.bg = self.BG
+        self.bold = False
+        self.reverse = False
+
+    def get_color(self, number, default):
+        number = int(number)
+
+        if number == self.DEFAULT:
+            return default
+
+        # anything past the 16 classic colors is left alone
+        return ansi.irc.get(number, None)
+
+    def sgr(self):
+        if self.reverse:
+            fg, bg = self.bg, self.fg
+        else:
+            fg, bg = self.fg, self.bg
+
+        bright = 1 if self.bold or fg > 7 else 0
+
+        return '\x1b[{};3{};4{}m'.format(bright, fg & 7, bg & 7)
+
+    def translate_code(self, match):
+        code = match.group(0)
+
+        if code == self.BOLD:
+            self.bold = not self.bold
+        elif code == self.REVERSE:
+            self.reverse = not self.reverse
+        elif code == self.RESET:
+            self.reset()
+
+            return '\x1b[0m'
+        else:
+            fg, bg = match.groups()
+
+            if fg is None:
+                self.fg = self.FG
+                self.bg = self.BG
+            else:
+                fg = self.get_color(fg, self.FG)
+
+                if not fg is None:
+                    self.fg = fg
+
+                if not bg is None:
+                    bg = self.get_color(bg, self.BG)
+
+                    if not bg is None:
+                        self.bg = bg
+
+        return self.sgr()
+
+    def feed(self, chunk):
+        # translated data, minus a trailing color code that could still be incomplete
+        data = self.pending + chunk
+        cut = data.rfind(self.COLOR, max(0, len(data)-self.HOLDBACK))
+
+        if cut == -1:
+            cut = len(data)
+
+        self.pending = data[cut:]
+
+        return self.CODES.sub(self.translate_code, data[:cut])
+
+    def close(self):
+        data = self.pending
+        self.pending = ''
+
+        return self.CODES.sub(self.translate_code, data)
+
+def translate(stream):
+    translator = IRCTranslator()
+
+    return translator.feed(stream) + translator.close()
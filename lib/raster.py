@@ -0,0 +1,386 @@
+#!/usr/bin/env python
+
+import array
+import binascii
+import collections
+import multiprocessing
+import string
+import struct
+import threading
+import zlib
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from cp437 import ansi
+
+# how many rows of text get rasterized at once by numpy when streaming scanlines
+BAND_ROWS = 32
+
+# text rows per band when PNGs are compressed in parallel
+PARALLEL_BAND_ROWS = 64
+
+# palette indexes as hex digits and bits, for packing indexed scanlines without numpy
+HEX_DIGITS = string.maketrans(''.join(map(chr, xrange(16))), '0123456789abcdef')
+BIT_DIGITS = string.maketrans('\x00\x01', '01')
+
+# zlib strategies by name, python 2 doesn't export all of the constants
+STRATEGIES = {'default': 0
+              ,'filtered': 1
+              ,'huffman': 2
+              ,'rle': 3
+              ,'fixed': 4}
+
+class GlyphCache(object):
+    # pixel strips for every combination of glyph, spacing and colors we've drawn lately.
+    # real art only uses a handful of combinations, so most cells are a single lookup.
+    # the module's glyph_cache is shared by every render, so it's guarded by a lock.
+    SIZE = 2048
+
+    def __init__(self, size=None):
+        self.size = size or self.SIZE
+        self.strips = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, c, spacing, bg, fg):
+        # bg and fg are RGB triplets, the result is the 16 rows of the glyph as RGB bytes
+        key = (c, spacing, bg, fg)
+
+        with self.lock:
+            strips = self.strips.pop(key, None)
+
+            if not strips is None:
+                self.strips[key] = strips
+
+                return strips
+
+        strips = self.render(c, spacing, bg, fg)
+
+        with self.lock:
+            if not key in self.strips and len(self.strips) >= self.size:
+                self.strips.popitem(last=False)
+
+            self.strips[key] = strips
+
+        return strips
+
+    def render(self, c, spacing, bg, fg):
+        colors = (''.join(map(chr, bg)), ''.join(map(chr, fg)))
+        shift = ansi.GLYPH_WIDTH-1
+
+        return tuple(''.join([colors[row >> (shift-x) & 1] for x in xrange(spacing)]) for row in ansi.glyph_rows(c))
+
+    def clear(self):
+        with self.lock:
+            self.strips.clear()
+
+glyph_cache = GlyphCache()
+
+def get_palette(screen):
+    return [tuple(screen.palette.get(i)) for i in xrange(16)]
+
+def get_indexes(screen):
+    # the same thing as get_palette, but with PLTE indexes instead of RGB triplets.
+    # NFO palettes only have two entries, anything that isn't black is the foreground.
+    if screen.palette.nfo:
+        return [(min(i, 1),) for i in xrange(16)]
+
+    return [(i,) for i in xrange(16)]
+
+def pack_scanline(scanline, bitdepth):
+    # a string of one palette index per pixel, packed down to bitdepth bits per pixel
+    if bitdepth == 4:
+        digits = scanline.translate(HEX_DIGITS)
+
+        if len(digits) & 1:
+            digits += '0'
+    elif bitdepth == 1:
+        bits = scanline.translate(BIT_DIGITS)
+        bits += '0' * (-len(bits) % 8)
+        digits = '{:0{}x}'.format(int(bits, 2), len(bits)/4)
+    else:
+        raise ValueError('bitdepth must be 1 or 4')
+
+    return array.array('B', binascii.unhexlify(digits))
+
+def render_row(screen, row, palette, cache=None):
+    # the 16 scanlines of a row of text, as RGB bytes
+    cache = cache or glyph_cache
+    cells = screen.drawbuffer.get(row, None)
+
+    if cells is None:
+        # TODO: swap the blank row out for magical custom background one day
+        strips = cache.get(0, screen.spacing, palette[0], palette[7])
+
+        return [strip*screen.width for strip in strips]
+
+    glyphs = [cache.get(c, screen.spacing, palette[attribute >> 4], palette[attribute & 0xF])
+              for c, attribute in zip(cells.characters, cells.attributes)]
+
+    return [''.join([strips[y] for strips in glyphs]) for y in xrange(ansi.GLYPH_HEIGHT)]
+
+bitmaps = None
+
+def get_bitmaps():
+    # the whole font as a (256, 16, 9) array of booleans
+    global bitmaps
+
+    if bitmaps is None:
+        rows = numpy.array(ansi.get_font(), dtype=numpy.uint16).reshape(256, ansi.GLYPH_HEIGHT)
+        shifts = numpy.arange(ansi.GLYPH_WIDTH-1, -1, -1, dtype=numpy.uint16)
+        bitmaps = (rows[:, :, None] >> shifts & 1).astype(bool)
+
+    return bitmaps
+
+def to_array(screen, start, end, palette=None):
+    # rows start to end of the screen as a (rows*16, width*spacing, 3) array of RGB pixels.
+    # palette swaps the RGB triplets for something else, like get_indexes.
+    if numpy is None:
+        raise ImportError('numpy is required to rasterize a screen into an array')
+
+    height = end - start
+    characters = numpy.zeros((height, screen.width), dtype=numpy.uint8)
+    attributes = numpy.empty((height, screen.width), dtype=numpy.uint8)
+    attributes.fill(0x07) # TODO: swap the blank row out for magical custom background one day
+
+    for i in xrange(height):
+        cells = screen.drawbuffer.get(start+i, None)
+
+        if cells is None:
+            continue
+
+        characters[i] = numpy.frombuffer(bytes(cells.characters), dtype=numpy.uint8)
+        attributes[i] = numpy.frombuffer(bytes(cells.attributes), dtype=numpy.uint8)
+
+    palette = numpy.array(palette or get_palette(screen), dtype=numpy.uint8)
+    channels = palette.shape[1]
+    glyphs = get_bitmaps()[characters][:, :, :, :screen.spacing]
+    fg = palette[attributes & 0xF][:, :, None, None, :]
+    bg = palette[attributes >> 4][:, :, None, None, :]
+
+    pixels = numpy.where(glyphs[..., None], fg, bg)
+
+    return pixels.transpose(0, 2, 1, 3, 4).reshape(height*ansi.GLYPH_HEIGHT, screen.width*screen.spacing, channels)
+
+def pack_array(pixels, bitdepth):
+    # the numpy version of pack_scanline, for a whole band of index pixels at once
+    if bitdepth == 1:
+        return numpy.packbits(pixels, axis=1)
+
+    if bitdepth != 4:
+        raise ValueError('bitdepth must be 1 or 4')
+
+    if pixels.shape[1] & 1:
+        pixels = numpy.pad(pixels, ((0, 0), (0, 1)), 'constant')
+
+    return pixels[:, 0::2] << 4 | pixels[:, 1::2]
+
+def render_rows(screen, start, end, cache=None):
+    if not numpy is None:
+        for band in xrange(start, end, BAND_ROWS):
+            pixels = to_array(screen, band, min(end, band+BAND_ROWS))
+
+            for scanline in pixels:
+                yield array.array('B', scanline.tostring())
+
+        return
+
+    palette = get_palette(screen)
+
+    for row in xrange(start, end):
+        for scanline in render_row(screen, row, palette, cache):
+            yield array.array('B', scanline)
+
+def render_indexed_rows(screen, start, end, bitdepth, cache=None):
+    # like render_rows, but packed palette indexes instead of RGB, for paletted PNGs
+    palette = get_indexes(screen)
+
+    if not numpy is None:
+        for band in xrange(start, end, BAND_ROWS):
+            pixels = to_array(screen, band, min(end, band+BAND_ROWS), palette)
+
+            for scanline in pack_array(pixels[:, :, 0], bitdepth):
+                yield array.array('B', scanline.tostring())
+
+        return
+
+    for row in xrange(start, end):
+        for scanline in render_row(screen, row, palette, cache):
+            yield pack_scanline(scanline, bitdepth)
+
+class PNGWriter(object):
+    # just enough of a PNG encoder for rendered screens: packed RGB or paletted scanlines
+    # in, with the zlib level and strategy up to the caller. pypng writes the chunks.
+    SIGNATURE = '\x89PNG\r\n\x1a\n'
+    COMPRESSION = 6
+    STRATEGY = 'default'
+    CHUNK_LIMIT = 2**20
+
+    def __init__(self, width, height, **kwargs):
+        self.width = width
+        self.height = height
+        self.palette = kwargs.setdefault('palette', None)
+        self.bitdepth = kwargs.setdefault('bitdepth', 8)
+        self.background = kwargs.setdefault('background', None)
+        self.compression = kwargs.setdefault('compression', None)
+        self.strategy = kwargs.setdefault('strategy', None)
+
+        if self.compression is None:
+            self.compression = self.COMPRESSION
+
+        if self.strategy is None:
+            self.strategy = self.STRATEGY
+
+        if not -1 <= self.compression <= 9:
+            raise ValueError('compression must be between 0 and 9')
+
+        if not self.strategy in STRATEGIES:
+            raise ValueError('strategy must be one of {}'.format(', '.join(sorted(STRATEGIES))))
+
+        if self.palette is None and not self.bitdepth == 8:
+            raise ValueError('RGB images must have a bitdepth of 8')
+
+    def compressor(self, raw=False):
+        # raw compressors leave out the zlib header and checksum, so bands can be stitched
+        wbits = -zlib.MAX_WBITS if raw else zlib.MAX_WBITS
+
+        return zlib.compressobj(self.compression, zlib.DEFLATED, wbits, 9, STRATEGIES[self.strategy])
+
+    def zlib_header(self):
+        # the header zlib itself would have written for our compression level
+        if 0 <= self.compression < 2:
+            level = 0
+        elif 2 <= self.compression < 6:
+            level = 1
+        elif self.compression in (-1, 6):
+            level = 2
+        else:
+            level = 3
+
+        cmf = 0x78 # deflate with a 32K window
+        flg = level << 6
+        flg += 31 - (cmf << 8 | flg) % 31
+
+        return struct.pack('!2B', cmf, flg)
+
+    def compress_band(self, rows, final):
+        # a piece of the image as raw deflate data, byte aligned and without any
+        # back references into other bands, plus what it takes to checksum it all later
+        compressor = self.compressor(raw=True)
+        compressed = list()
+        checksum = 1
+        length = 0
+
+        for row in rows:
+            data = '\x00' + row.tostring()
+            checksum = zlib.adler32(data, checksum)
+            length += len(data)
+            compressed.append(compressor.compress(data))
+
+        compressed.append(compressor.flush(zlib.Z_FINISH if final else zlib.Z_FULL_FLUSH))
+
+        return ''.join(compressed), checksum & 0xFFFFFFFF, length
+
+    def write_header(self, fp):
+        import png
+
+        color_type = 3 if self.palette else 2
+
+        fp.write(self.SIGNATURE)
+        png.write_chunk(fp, 'IHDR', struct.pack('!2I5B', self.width, self.height, self.bitdepth, color_type, 0, 0, 0))
+
+        if self.palette:
+            png.write_chunk(fp, 'PLTE', ''.join([struct.pack('!3B', *color) for color in self.palette]))
+        elif self.background:
+            png.write_chunk(fp, 'bKGD', struct.pack('!3H', *self.background))
+
+    def write(self, fp, rows):
+        # rows are packed scanlines, like render_rows and render_indexed_rows give out
+        import png
+
+        self.write_header(fp)
+
+        compressor = self.compressor()
+        data = array.array('B')
+
+        for row in rows:
+            data.append(0) # no filtering, glyph rows repeat enough for zlib to find on its own
+            data.extend(row)
+
+            if len(data) > self.CHUNK_LIMIT:
+                compressed = compressor.compress(data.tostring())
+
+                if compressed:
+                    png.write_chunk(fp, 'IDAT', compressed)
+
+                del data[:]
+
+        png.write_chunk(fp, 'IDAT', compressor.compress(data.tostring()) + compressor.flush())
+        png.write_chunk(fp, 'IEND')
+
+    def write_bands(self, fp, bands):
+        # bands are compress_band results, in order, with the last one final
+        import png
+
+        self.write_header(fp)
+
+        checksum = 1
+        data = [self.zlib_header()]
+
+        for compressed, band_checksum, length in bands:
+            checksum = adler32_combine(checksum, band_checksum, length)
+            data.append(compressed)
+
+            if sum(map(len, data)) > self.CHUNK_LIMIT:
+                png.write_chunk(fp, 'IDAT', ''.join(data))
+                data = list()
+
+        data.append(struct.pack('!I', checksum))
+
+        png.write_chunk(fp, 'IDAT', ''.join(data))
+        png.write_chunk(fp, 'IEND')
+
+def adler32_combine(first, second, length):
+    # the checksum of two pieces of data from theirs and the length of the second,
+    # zlib has this but python doesn't expose it
+    base = 65521
+    remainder = length % base
+    low = first & 0xFFFF
+    high = remainder * low % base
+    low += (second & 0xFFFF) + base - 1
+    high += (first >> 16 & 0xFFFF) + (second >> 16 & 0xFFFF) + base - remainder
+
+    return low % base | (high % base) << 16
+
+band_screen = None
+
+def set_band_screen(screen):
+    # pool initializer, so the screen is sent to each worker once instead of per band
+    global band_screen
+
+    band_screen = screen
+
+def compress_screen_band(job):
+    writer, start, end, final = job
+
+    if writer.palette:
+        rows = render_indexed_rows(band_screen, start, end, writer.bitdepth)
+    else:
+        rows = render_rows(band_screen, start, end)
+
+    return writer.compress_band(rows, final)
+
+def write_parallel(fp, writer, screen, start, end, workers):
+    # rasterize and compress bands of the screen across a pool of processes, then
+    # stitch them into one PNG. workers of 0 means one per CPU.
+    jobs = [(writer, band, min(end, band+PARALLEL_BAND_ROWS), band+PARALLEL_BAND_ROWS >= end)
+            for band in xrange(start, end, PARALLEL_BAND_ROWS)]
+    pool = multiprocessing.Pool(workers or None, set_band_screen, (screen,))
+
+    try:
+        writer.write_bands(fp, pool.imap(compress_screen_band, jobs))
+    finally:
+        pool.terminate()
+        pool.join()
@@ -1,12 +1,21 @@
 #!usr/bin/env python
 
+import re
 import sys
 
-import png
-
 import cp437
 from cp437 import ansi
 
+# a run of bytes with no escapes in it, which can be printed straight to the screen
+PRINT_RUN = re.compile('[^\x1b]+')
+
+# everything following the bracket of a CSI escape: an optional private-mode prefix,
+# the numeric parameters and the command byte (missing if the tape ran out first)
+CSI_SEQUENCE = re.compile('\\[(\\?1;)?([0-9;]*)(.?)', re.S)
+
+# a run of cells sharing the same packed attribute
+ATTRIBUTE_RUN = re.compile('(.)\\1*', re.S)
+
 class VT100Palette(object):
     PALETTE = None
 
@@ -58,29 +67,82 @@ class VT100Block(object):
     FOREGROUND = 0
     CHARACTER = 0
 
+    # blocks are immutable, so there only ever needs to be one of each. VT100Block.get
+    # hands out the shared ones without going through any of the validation below.
+    BLOCKS = [None]*(256*16*16)
+
+    __slots__ = ('background', 'foreground', 'character')
+
     def __init__(self, *args, **kwargs):
-        self.background = kwargs.setdefault('background', kwargs.setdefault('bg', self.BACKGROUND))
-        self.foreground = kwargs.setdefault('foreground', kwargs.setdefault('fg', self.FOREGROUND))
-        self.character = kwargs.setdefault('character', kwargs.setdefault('c', self.CHARACTER))
+        background = kwargs.setdefault('background', kwargs.setdefault('bg', self.BACKGROUND))
+        foreground = kwargs.setdefault('foreground', kwargs.setdefault('fg', self.FOREGROUND))
+        character = kwargs.setdefault('character', kwargs.setdefault('c', self.CHARACTER))
 
-        if not isinstance(self.background, int):
+        if not isinstance(background, int):
             raise ValueError('background must be an int')
 
-        if not isinstance(self.foreground, int):
+        if not isinstance(foreground, int):
             raise ValueError('foreground must be an int')
 
-        if not isinstance(self.character, int) and not isinstance(self.character, str):
+        if not isinstance(character, int) and not isinstance(character, str):
             raise ValueError('character must be either an int or a single-character string')
 
-        if not 0 <= self.background < 16:
-            raise ValueError('background color must be a value from 0-15')
+        if isinstance(character, str):
+            if not len(character) == 1:
+                raise ValueError('character must be either an int or a single-character string')
+
+            character = ord(character)
 
-        if not 0 <= self.foreground < 16:
+        if not 0 <= background < 16:
             raise ValueError('background color must be a value from 0-15')
 
-        if not 0 <= self.character < 256:
+        if not 0 <= foreground < 16:
+            raise ValueError('foreground color must be a value from 0-15')
+
+        if not 0 <= character < 256:
             raise ValueError('character must be a value from 0-255')
 
+        object.__setattr__(self, 'background', background)
+        object.__setattr__(self, 'foreground', foreground)
+        object.__setattr__(self, 'character', character)
+
+    @classmethod
+    def get(cls, c, fg, bg):
+        index = c | fg << 8 | bg << 12
+        block = cls.BLOCKS[index]
+
+        if block is None:
+            block = object.__new__(cls)
+            object.__setattr__(block, 'background', bg)
+            object.__setattr__(block, 'foreground', fg)
+            object.__setattr__(block, 'character', c)
+            cls.BLOCKS[index] = block
+
+        return block
+
+    def __setattr__(self, name, value):
+        raise AttributeError('VT100Block objects are immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('VT100Block objects are immutable')
+
+    def __eq__(self, other):
+        if not isinstance(other, VT100Block):
+            return NotImplemented
+
+        return (self.c, self.fg, self.bg) == (other.c, other.fg, other.bg)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+
+        if result is NotImplemented:
+            return result
+
+        return not result
+
+    def __hash__(self):
+        return hash((self.c, self.fg, self.bg))
+
     @property
     def bg(self):
         return self.background
@@ -99,6 +161,94 @@ class VT100Block(object):
     def __repr__(self):
         return '<VT100Block: character:{}/background:{}/foreground:{}>'.format(self.c, self.bg, self.fg)
 
+class VT100Row(object):
+    # a row of cells packed into two byte arrays: the character of each cell and its
+    # attribute, which is the foreground in the low nibble and the background in the high
+    DEFAULT_ATTRIBUTE = 0x07
+
+    __slots__ = ('characters', 'attributes')
+
+    def __init__(self, width, attribute=DEFAULT_ATTRIBUTE):
+        self.characters = bytearray(width)
+        self.attributes = bytearray(chr(attribute)*width)
+
+    @staticmethod
+    def pack(fg, bg):
+        return fg | bg << 4
+
+    def fill(self, start, end, c, attribute):
+        self.characters[start:end] = chr(c)*(end-start)
+        self.attributes[start:end] = chr(attribute)*(end-start)
+
+    def __len__(self):
+        return len(self.characters)
+
+    def __contains__(self, col):
+        return 0 <= col < len(self.characters)
+
+    def __getitem__(self, col):
+        attribute = self.attributes[col]
+
+        return VT100Block.get(self.characters[col], attribute & 0xF, attribute >> 4)
+
+    def __setitem__(self, col, block):
+        self.characters[col] = block.c
+        self.attributes[col] = self.pack(block.fg, block.bg)
+
+class VT100LineBuffer(object):
+    # fixed number of rows kept in a ring, addressed by their absolute row number. rows
+    # scroll off the top by moving the start of the window, nothing gets shuffled around.
+    def __init__(self, capacity):
+        if not capacity > 0:
+            raise ValueError('line buffer must hold at least one row')
+
+        self.capacity = capacity
+        self.start = 0
+        self.indexes = [None]*capacity
+        self.rows = [None]*capacity
+
+    def scroll_to(self, start):
+        self.start = max(self.start, start)
+
+    def __contains__(self, index):
+        return index >= self.start and self.indexes[index % self.capacity] == index
+
+    def __getitem__(self, index):
+        if not index in self:
+            raise KeyError(index)
+
+        return self.rows[index % self.capacity]
+
+    def __setitem__(self, index, row):
+        if not self.start <= index < self.start + self.capacity:
+            raise IndexError('row {} is outside of the line buffer'.format(index))
+
+        self.indexes[index % self.capacity] = index
+        self.rows[index % self.capacity] = row
+
+    def __delitem__(self, index):
+        if not index in self:
+            raise KeyError(index)
+
+        self.indexes[index % self.capacity] = None
+        self.rows[index % self.capacity] = None
+
+    def get(self, index, default=None):
+        if not index in self:
+            return default
+
+        return self.rows[index % self.capacity]
+
+    def memory_size(self):
+        # bytes taken up by the ring and the rows in it
+        size = sys.getsizeof(self.indexes) + sys.getsizeof(self.rows)
+
+        for row in self.rows:
+            if not row is None:
+                size += sys.getsizeof(row) + sys.getsizeof(row.characters) + sys.getsizeof(row.attributes)
+
+        return size
+
 class VT100Screen(object):
     SPACING_9PX = True
     SPACING_8PX = False
@@ -108,6 +258,8 @@ class VT100Screen(object):
     SPACING = True
     NFO = False
     PALETTE = None
+    DUMP_BUFFER = 65536
+    SGR_TRANSITIONS = [None]*(256*256)
 
     def __init__(self, *args, **kwargs):
         self.width = kwargs.setdefault('width', self.WIDTH)
@@ -135,8 +287,8 @@ class VT100Screen(object):
                 if not 0 <= c < 256:
                     raise ValueError('RGB value must be a number between 0-255 inclusive')
 
-        self.drawbuffer = dict()
-        self.scroll = 0
+        self.drawbuffer = VT100LineBuffer(self.linebuffer)
+        self.scroll = 0 # first row still in the line buffer
         self.vX = 0 # viewing window
         self.vY = 0
         self.dX = 0 # drawing position
@@ -154,15 +306,27 @@ class VT100Screen(object):
         self.check_linebuffer()
 
     def check_linebuffer(self):
-        if self.dY < self.linebuffer:
+        if self.dY - self.scroll < self.linebuffer:
             return
 
-        scroll = self.dY - self.linebuffer
-        self.delete_rows(self.scroll,scroll+1)
-        self.scroll = scroll
+        self.scroll = self.dY - self.linebuffer + 1
+        self.drawbuffer.scroll_to(self.scroll)
+
+    def get_row(self, row):
+        if not row in self.drawbuffer:
+            self.drawbuffer[row] = VT100Row(self.width)
+
+        return self.drawbuffer[row]
+
+    def get_block(self, col, row):
+        if not row in self.drawbuffer:
+            return VT100Block.get(0, 7, 0)
+
+        return self.drawbuffer[row][col]
 
     def draw(self, c):
-        cp437.debug_state('drawing onto screen')
+        if cp437.DEBUG >= cp437.DEBUG_STATE:
+            cp437.debug_state('drawing onto screen')
 
         if self.palette.nfo:
             self.bg = 0
@@ -172,9 +336,8 @@ class VT100Screen(object):
         if self.bright and self.fg < 8:
             self.fg += 8
 
-        block = VT100Block(c=c, bg=self.bg, fg=self.fg)
-
-        cp437.debug_state('screen state> dX: {} / dY: {} / block: {}', self.dX, self.dY, repr(block))
+        if cp437.DEBUG >= cp437.DEBUG_STATE:
+            cp437.debug_state('screen state> dX: {} / dY: {} / block: {}', self.dX, self.dY, repr(VT100Block.get(c, self.fg, self.bg)))
 
         if c == 0xA: # newline
             self.dX = 0
@@ -185,13 +348,56 @@ class VT100Screen(object):
         else:
             self.check_eol()
 
-            row = self.drawbuffer.setdefault(self.dY, dict())
-            row[self.dX] = block
+            row = self.get_row(self.dY)
+            row.characters[self.dX] = c
+            row.attributes[self.dX] = VT100Row.pack(self.fg, self.bg)
             self.dX += 1
 
             self.check_eol()
 
-        cp437.debug_state('screen state< dX: {} / dY: {}', self.dX, self.dY)
+        if cp437.DEBUG >= cp437.DEBUG_STATE:
+            cp437.debug_state('screen state< dX: {} / dY: {}', self.dX, self.dY)
+
+    def draw_run(self, run):
+        # same as calling draw on every byte of the run, but the attributes only get
+        # looked at once and cells get written a line span at a time
+        if cp437.DEBUG >= cp437.DEBUG_STATE:
+            cp437.debug_state('drawing {} bytes onto screen', len(run))
+
+        if self.palette.nfo:
+            self.bg = 0
+            self.fg = 1
+            self.bright = 0
+
+        if self.bright and self.fg < 8:
+            self.fg += 8
+
+        attribute = chr(VT100Row.pack(self.fg, self.bg))
+
+        for i, line in enumerate(run.split('\n')):
+            if i > 0: # newline
+                self.dX = 0
+                self.dY += 1
+                self.check_linebuffer()
+
+            if '\r' in line: # carriage return
+                line = line.replace('\r', '')
+
+            while line:
+                self.check_eol()
+
+                span = line[:self.width - self.dX]
+                line = line[len(span):]
+
+                row = self.get_row(self.dY)
+                row.characters[self.dX:self.dX+len(span)] = span
+                row.attributes[self.dX:self.dX+len(span)] = attribute*len(span)
+                self.dX += len(span)
+
+                self.check_eol()
+
+        if cp437.DEBUG >= cp437.DEBUG_STATE:
+            cp437.debug_state('screen state< dX: {} / dY: {}', self.dX, self.dY)
 
     def delete_rows(self, d_from, d_to):
         for i in range(d_from,d_to):
@@ -199,7 +405,8 @@ class VT100Screen(object):
                 del self.drawbuffer[i]
 
     def reset_attributes(self):
-        cp437.debug_state('resetting attributes')
+        if cp437.DEBUG >= cp437.DEBUG_STATE:
+            cp437.debug_state('resetting attributes')
 
         self.bg = 0
         self.fg = 7 if not self.palette.nfo else 1
@@ -210,132 +417,166 @@ class VT100Screen(object):
         self.hidden = False
 
     def dump_str(self, colors=False, utf8=False):
-        end = self.dY+1
-        result = list()
-        current_color = {'fg': 7, 'bg': 0, 'bright': False}
+        return ''.join(self.iter_lines(colors, utf8))
 
-        for row in xrange(end):
-            if not row in self.drawbuffer:
-                if not row+1 == end:
-                    result.append(' '*self.width)
-                    result.append('\n')
+    def dump_to(self, fp, colors=False, utf8=False, encoding='utf8'):
+        # writes the rendering out a buffer's worth at a time rather than building the
+        # whole thing in memory. unicode gets encoded on the way out unless encoding is None.
+        pending = list()
+        pending_size = 0
 
-                continue
+        for line in self.iter_lines(colors, utf8):
+            if encoding is not None and isinstance(line, unicode):
+                line = line.encode(encoding)
 
-            last_col = 0
+            pending.append(line)
+            pending_size += len(line)
 
-            for col in xrange(self.width):
-                delta = col - last_col
-                last_col = col
+            if pending_size >= self.DUMP_BUFFER:
+                fp.write(''.join(pending))
+                pending = list()
+                pending_size = 0
 
-                if not col in self.drawbuffer[row]:
-                    block = VT100Block(bg=0,fg=7,c=0)
-                else:
-                    block = self.drawbuffer[row][col]
+        if pending:
+            fp.write(''.join(pending))
 
-                codes = list()
+    @classmethod
+    def sgr_transition(cls, current, attribute):
+        # the escape that takes the terminal from one packed attribute to the next. there
+        # are only 256 attributes, so every transition gets worked out once and kept.
+        index = current << 8 | attribute
+        transition = cls.SGR_TRANSITIONS[index]
 
-                if colors:
-                    block_color = {'fg': block.fg, 'bg': block.bg, 'bright': block.fg > 7}
+        if not transition is None:
+            return transition
 
-                    if not block_color == current_color:
-                        result.append('\x1b[')
-                        reset = False
+        if current == attribute:
+            transition = ''
+        else:
+            fg = attribute & 0xF
+            bg = attribute >> 4
+            bright = fg > 7
+            current_fg = current & 0xF
+            current_bright = current_fg > 7
+            codes = list()
+            reset = False
+
+            if not bright == current_bright:
+                if current_bright and not bright:
+                    codes.append('0')
+                    reset = True
+                elif not current_bright and bright:
+                    codes.append('1')
+
+            if not fg == current_fg or reset:
+                codes.append('3{}'.format(fg - bright*8))
+
+            if not bg == current >> 4 or reset:
+                codes.append('4{}'.format(bg))
+
+            if fg == 7 and bg == 0:
+                transition = '\x1b[0m'
+            else:
+                transition = '\x1b[{}m'.format(';'.join(codes))
 
-                        if not block_color['bright'] == current_color['bright']:
-                            if current_color['bright'] and not block_color['bright']:
-                                codes.append('0')
-                                reset = True
-                            elif not current_color['bright'] and block_color['bright']:
-                                codes.append('1')
+        cls.SGR_TRANSITIONS[index] = transition
 
-                        if not block_color['fg'] == current_color['fg'] or reset:
-                            fg_color = block_color['fg']
-                            fg_color -= block_color['bright']*8
-                            codes.append('3{}'.format(fg_color))
+        return transition
+
+    def iter_lines(self, colors=False, utf8=False):
+        end = self.dY+1
+        current_attribute = VT100Row.DEFAULT_ATTRIBUTE
+        render = ansi.render_unicode if utf8 else ansi.render_ascii
 
-                        if not block_color['bg'] == current_color['bg'] or reset:
-                            codes.append('4{}'.format(block_color['bg']))
+        for row in xrange(self.scroll, end):
+            if not row in self.drawbuffer:
+                if not row+1 == end:
+                    yield ' '*self.width + '\n'
 
-                        if block_color['fg'] == 7 and block_color['bg'] == 0:
-                            result.append('0m')
-                        else:
-                            result.append('{}m'.format(';'.join(codes)))
+                continue
 
-                        current_color = block_color
+            row_data = self.drawbuffer[row]
+            result = list()
 
-                c = block.c
+            if colors:
+                spans = ATTRIBUTE_RUN.finditer(str(row_data.attributes))
+            else:
+                spans = [None]
 
-                if c == 0:
-                    c = 32
-                    
-                if utf8:
-                    c = unichr(ansi.utf8[c])
+            for span in spans:
+                if span is None:
+                    characters = row_data.characters
                 else:
-                    c = chr(c)
+                    attribute = row_data.attributes[span.start()]
+                    result.append(self.sgr_transition(current_attribute, attribute))
+                    current_attribute = attribute
+                    characters = row_data.characters[span.start():span.end()]
 
-                result.append(c)
+                result.append(render(characters))
 
             result.append('\n')
 
-        return ''.join(result)
+            yield ''.join(result)
+
+    def dump_png(self, outfile, paletted=None, compression=None, strategy=None, workers=None):
+        # outfile is either a filename or anything with a write method. scanlines get handed
+        # to the writer a row of text at a time, so tall screens don't need more memory.
+        # paletted writes 4-bit (1-bit for NFO) palette indexes instead of RGB, which is a
+        # fraction of the data to compress. by default it's used whenever the palette fits.
+        # compression is the zlib level and strategy one of raster.STRATEGIES, both default
+        # to raster.PNGWriter's. workers above 1 (or 0, for one per CPU) rasterizes and
+        # compresses bands of the screen in that many processes.
+        from cp437 import raster
+
+        if paletted is None:
+            paletted = self.palette.depth <= 16
+
+        if isinstance(outfile, basestring):
+            fp = open(outfile, 'wb')
+        else:
+            fp = outfile
 
-    def dump_png(self, outfile):
-        fp = open(outfile, 'wb')
         end = self.dY
-        colors = ansi.colors.items()
-        colors.sort(lambda x,y: cmp(x[0],y[0]))
-        colors = map(lambda x: x[1], colors)
-        output = png.Writer(width=self.width*self.spacing
-                            ,height=end*16
-                            ,alpha=False # TODO: custom backgrounds for presence of no characters
-                            ,background=ansi.colors[0]
-                            ,compression=9) # 'cause why not?
-        
-        # the goal here is to fill in the blanks, so this is sort of like the dump-to-string algorithm
-        result = list()
-        image_data = list()
-
-        for row in xrange(end):
-            if not row in self.drawbuffer:
-                self.drawbuffer[row] = dict()
+        width = self.width*self.spacing
+        height = (end-self.scroll)*16
+
+        if paletted:
+            bitdepth = 1 if self.palette.depth <= 2 else 4
+            output = raster.PNGWriter(width
+                                      ,height
+                                      ,palette=[tuple(self.palette.get(i)) for i in xrange(self.palette.depth)]
+                                      ,bitdepth=bitdepth
+                                      ,compression=compression
+                                      ,strategy=strategy)
+            rows = raster.render_indexed_rows(self, self.scroll, end, bitdepth)
+        else:
+            output = raster.PNGWriter(width
+                                      ,height
+                                      ,background=ansi.colors[0] # TODO: custom backgrounds for presence of no characters
+                                      ,compression=compression
+                                      ,strategy=strategy)
+            rows = raster.render_rows(self, self.scroll, end)
+
+        try:
+            if workers is None or workers == 1 or end-self.scroll <= raster.PARALLEL_BAND_ROWS:
+                output.write(fp, rows)
+            else:
+                raster.write_parallel(fp, output, self, self.scroll, end, workers)
+        finally:
+            if not fp is outfile:
+                fp.close()
 
-            row_data = [list() for x in xrange(16)]
+    def to_array(self):
+        # the whole screen as a numpy array of RGB pixels, shaped (height, width, 3)
+        from cp437 import raster
 
-            for col in xrange(self.width):
-                if not col in self.drawbuffer[row]:
-                    #cp437.debug('PNG drawing null-block at {}, {}', col, row)
-                    # TODO: swap this out for magical custom background one day
-                    block = VT100Block(c=0
-                                       ,fg=7
-                                       ,bg=0)
-                else:
-                    block = self.drawbuffer[row][col]
-                    #cp437.debug('PNG drawing {} at {}, {}', repr(block), col, row)
-                    
-                current_color = {'fg': block.fg, 'bg': block.bg}
-                pixel_map = ansi.charset[block.c]
-
-                #cp437.debug('PNG converting {} into pixels', repr(block))
-
-                for y in xrange(16):
-                    for x in xrange(self.spacing):
-                        pix = pixel_map[y][x]
-                        color = ('bg', 'fg')[pix]
-                        pixel = self.palette.get(current_color[color])
-                      
-                        for c in pixel:
-                            row_data[y].append(c)
-                                    
-            for subrow in row_data:
-                image_data.append(subrow)
-
-        #print image_data
-        output.write(fp, image_data)
-        fp.close()
+        return raster.to_array(self, self.scroll, self.dY)
 
     def __str__(self):
-        return dump_str()
+        return self.dump_str()
+
+    def memory_size(self):
+        return self.drawbuffer.memory_size()
 
     def __repr__(self):
         return '<VT100Screen: width:{}/height:{}/linebuffer:{}>'.format(self.width, self.height, self.linebuffer)
@@ -356,6 +597,10 @@ class PrintEvent(VT100Event):
     def __call__(self, character):
         return self.screen.draw(character)
 
+class PrintRunEvent(VT100Event):
+    def __call__(self, run):
+        return self.screen.draw_run(run)
+
 class NopEvent(VT100Event):
     def __call__(self):
         return
@@ -367,8 +612,10 @@ class CursorShiftEvent(VT100Event):
     LEFT = 'D'
 
     def __call__(self, direction, shift):
-        cp437.debug_event('cursor shift event: {} by {}'.format({'A': 'up', 'B': 'down', 'C': 'right', 'D': 'left'}[direction]
-                                                          ,shift))
+        if cp437.DEBUG >= cp437.DEBUG_EVENT:
+            cp437.debug_event('cursor shift event: {} by {}'
+                              ,{'A': 'up', 'B': 'down', 'C': 'right', 'D': 'left'}.get(direction, direction)
+                              ,shift)
 
         if not direction in 'ABCD':
             raise ValueError('direction must be one of CursorShiftEvent.{UP,DOWN,RIGHT,LEFT}')
@@ -377,292 +624,433 @@ class CursorShiftEvent(VT100Event):
             self.screen.fg += 8
 
         if direction == 'A':
-            self.screen.dY = max(0, self.screen.dY - shift)
+            self.screen.dY = max(self.screen.scroll, self.screen.dY - shift)
         elif direction == 'B':
             old_dY = self.screen.dY
 
             self.screen.dY = self.screen.dY + shift
+            self.screen.check_linebuffer()
 
-            for i in range(self.screen.dY - old_dY):
-                for j in range(self.screen.width):
-                    if not i in self.screen.drawbuffer:
-                        self.screen.drawbuffer[old_dY+i] = dict()
+            attribute = VT100Row.pack(self.screen.fg, self.screen.bg)
 
-                    self.screen.drawbuffer[old_dY+i][j] = VT100Block(c=0, fg=self.screen.fg, bg=self.screen.bg)
+            for i in xrange(max(old_dY, self.screen.scroll), self.screen.dY):
+                self.screen.drawbuffer[i] = VT100Row(self.screen.width, attribute)
         elif direction == 'C':
             old_dX = self.screen.dX
 
             self.screen.dX = min(self.screen.width, self.screen.dX + shift)
 
-            if not self.screen.dY in self.screen.drawbuffer:
-                self.screen.drawbuffer[self.screen.dY] = dict()
-
-            for i in range(self.screen.dX - old_dX):
-                self.screen.drawbuffer[self.screen.dY][old_dX+i] = VT100Block(c=0, fg=self.screen.fg, bg=self.screen.bg)
+            row = self.screen.get_row(self.screen.dY)
+            row.fill(old_dX, self.screen.dX, 0, VT100Row.pack(self.screen.fg, self.screen.bg))
         elif direction == 'D':
             self.screen.dX = max(0, self.screen.dX - shift)
 
         self.screen.check_eol()
 
-        cp437.debug_state('screen state is now: dX: {} / dY: {}', self.screen.dX, self.screen.dY)
+        if cp437.DEBUG >= cp437.DEBUG_STATE:
+            cp437.debug_state('screen state is now: dX: {} / dY: {}', self.screen.dX, self.screen.dY)
 
 class VT100Parser(object):
     EVENT_TABLE = None
+    CHUNK_SIZE = 65536
+
+    # escape sequences with no parameters worth parsing, by everything after the escape.
+    # subclasses can extend this, the event classes go through the event table as usual.
+    STATIC_SEQUENCES = {
+        '[7h': UnknownEvent,
+        '[20h': UnknownEvent,
+        '[?1h': UnknownEvent,
+        '[?3h': UnknownEvent,
+        '[?33h': UnknownEvent,
+        '[?4h': UnknownEvent,
+        '[?5h': UnknownEvent,
+        '[?6h': UnknownEvent,
+        '[?7h': UnknownEvent,
+        '[?8h': UnknownEvent,
+        '[?9h': UnknownEvent,
+        '[20l': UnknownEvent,
+        '[?1l': UnknownEvent,
+        '[?2l': UnknownEvent,
+        '[?3l': UnknownEvent,
+        '[?4l': UnknownEvent,
+        '[?5l': UnknownEvent,
+        '[?6l': UnknownEvent,
+        '[?7l': UnknownEvent,
+        '[?8l': UnknownEvent,
+        '[?9l': UnknownEvent,
+        '[g': UnknownEvent,
+        '[0g': UnknownEvent,
+        '[3g': UnknownEvent,
+        '[K': UnknownEvent,
+        '[0K': UnknownEvent,
+        '[1K': UnknownEvent,
+        '[2K': UnknownEvent,
+        '[J': UnknownEvent,
+        '[0J': UnknownEvent,
+        '[1J': UnknownEvent,
+        '[2J': UnknownEvent,
+        '[c': UnknownEvent,
+        '[0c': UnknownEvent,
+        '[2;1y': UnknownEvent,
+        '[2;2y': UnknownEvent,
+        '[2;9y': UnknownEvent,
+        '[2;10y': UnknownEvent,
+        '[0q': UnknownEvent,
+        '[1q': UnknownEvent,
+        '[2q': UnknownEvent,
+        '[3q': UnknownEvent,
+        '[4q': UnknownEvent}
+
+    # SAUCE and COMNT trailers can stack, so this is how far from the end of the
+    # stream one can start.
+    TRAILER_SIZE = 129 + 132 + 201
 
     def __init__(self, *args, **kwargs):
         self.stream = None
+        self.file = None
+        self.file_start = None
 
-        if not 'file' in kwargs and not 'filename' in kwargs and not 'stream' in kwargs:
-            raise ValueError('no file, filename or stream present')
+        # a parser fed by hand only needs a screen, anything else needs something to parse
+        if not 'file' in kwargs and not 'filename' in kwargs and not 'stream' in kwargs and not 'screen' in kwargs:
+            raise ValueError('no file, filename, stream or screen present')
+
+        # filenames get opened (and closed) by every parse, files are read from where they
+        # are now and rewound there to be parsed again, if they can be
+        self.filename = kwargs.get('filename', None)
 
-        if 'filename' in kwargs:
-            self.filename = kwargs['filename']
-            kwargs['file'] = open(self.filename, 'rb')
-        else:
-            self.filename = None
-            
         if 'file' in kwargs:
-            self.stream = kwargs['file'].read()
+            self.file = kwargs['file']
 
-        if 'stream' in kwargs and not self.stream:
+            try:
+                self.file_start = self.file.tell()
+            except (AttributeError, IOError):
+                pass
+        elif 'stream' in kwargs:
             self.stream = kwargs['stream']
 
+        self.parsed = False
+        self.screen = kwargs.setdefault('screen', None)
         self.event_table = kwargs.setdefault('event_table', self.EVENT_TABLE)
 
         if self.event_table is None:
             self.event_table = dict()
 
+        self.static_trie = self.get_static_trie()
+        self.buffer = ''
+        self.offset = 0 # where the buffer starts in the stream
+        self.bind_events(self.screen)
+
+    @classmethod
+    def get_static_trie(cls):
+        # built once per class, each node maps the next byte to a child node and None to
+        # the event of the sequence ending there
+        if '_static_trie' in cls.__dict__:
+            return cls._static_trie
+
+        trie = dict()
+
+        for sequence, event in cls.STATIC_SEQUENCES.items():
+            node = trie
+
+            for c in sequence:
+                node = node.setdefault(c, dict())
+
+            node[None] = event
+
+        cls._static_trie = trie
+
+        return trie
+
+    def match_static(self, peek_index, tape_eof):
+        # longest static sequence starting at peek_index, returns (event, end, partial)
+        # where partial means the tape ran out while a longer sequence was still possible
+        stream = self.buffer
+        node = self.static_trie
+        event = None
+        end = peek_index
+        i = peek_index
+
+        while i < tape_eof:
+            node = node.get(stream[i])
+
+            if node is None:
+                return event, end, False
+
+            i += 1
+
+            if None in node:
+                event = node[None]
+                end = i
+
+        return event, end, len(node) > (None in node)
+
+    def bind_events(self, screen):
+        # events only hold onto their screen, so one instance of each is enough for as
+        # long as we're drawing onto the same screen
+        self.bound_screen = screen
+        self.events = dict()
+
     def get_event(self, event, screen):
-        if not issubclass(event, VT100Event):
-            raise ValueError('event must subclass the VT100Event object')
+        if not screen is self.bound_screen:
+            self.bind_events(screen)
+
+        bound = self.events.get(event)
+
+        if bound is None:
+            if not issubclass(event, VT100Event):
+                raise ValueError('event must subclass the VT100Event object')
+
+            bound = self.event_table.get(event, event)(screen)
+            self.events[event] = bound
+
+        return bound
 
-        return self.event_table.get(event, event)(screen)
-            
     def parse(self, screen):
-        tape_index = 0
-        peek_index = 0
-        tape_eof = len(self.stream)
-        print_state = 0
-        esc_state = 1
-        bracket_state = 2
-        paren_state = 3
-        pound_state = 4
-        numeric_state = 5
-        alpha_state = 6
-        alnum_state = 7
-        state = print_state
-        bg = 0
-        fg = 0
+        if self.filename is None and self.file is None and self.stream is None:
+            raise ValueError('no file, filename or stream present')
+
+        if not self.file is None:
+            if getattr(self.file, 'closed', False):
+                raise ValueError('file was closed before it was parsed')
+
+            if self.parsed:
+                if self.file_start is None:
+                    raise ValueError('file can only be parsed once, it can\'t be rewound')
+
+                self.file.seek(self.file_start)
+
+        self.screen = screen
+        self.buffer = ''
+        self.offset = 0
+        self.bind_events(screen)
+
+        if not self.filename is None:
+            fp = open(self.filename, 'rb')
+
+            try:
+                self.feed_file(fp)
+            finally:
+                fp.close()
+        elif not self.file is None:
+            self.feed_file(self.file)
+        else:
+            self.feed(self.stream)
+
+        self.close()
+        self.parsed = True
+
+    def feed_file(self, fp):
+        while True:
+            chunk = fp.read(self.CHUNK_SIZE)
+
+            if not chunk:
+                break
+
+            self.feed(chunk)
+
+    def feed(self, chunk):
+        if self.screen is None:
+            raise ValueError('no screen to draw onto, pass one to the parser with screen=')
+
+        self.buffer += chunk
+        tape_eof = len(self.buffer)
+
+        # anything that could be the start of a SAUCE or COMNT trailer is held back until
+        # we know whether or not it's the end of the stream.
+        trailer = self.buffer.find('\x1a', max(0, tape_eof - self.TRAILER_SIZE))
+
+        if not trailer == -1:
+            tape_eof = trailer
+
+        tape_index = self.consume(0, tape_eof, False)
+        self.buffer = self.buffer[tape_index:]
+        self.offset += tape_index
+
+    def has_trailer(self, size, marker):
+        # whether the stream ends in a size byte trailer starting with marker. the buffer
+        # may only hold the end of the stream, which is too short to hold the trailer.
+        if len(self.buffer) < size and self.offset > 0:
+            return False
+
+        return self.buffer[-size:][:len(marker)] == marker
+
+    def close(self):
+        if self.screen is None:
+            raise ValueError('no screen to draw onto, pass one to the parser with screen=')
 
         # first, look for a PabloDraw SAUCE header.
         # parse it later tho lol
-        sauce = self.stream[-129:]
+        if self.has_trailer(129, '\x1aSAUCE'):
+            if cp437.DEBUG >= cp437.DEBUG_EVENT:
+                cp437.debug_event('found Pablo sauce')
+            self.buffer = self.buffer[:-129]
+
+        if self.has_trailer(132, '\x1a\x00\x00\x00SAUCE'):
+            if cp437.DEBUG >= cp437.DEBUG_EVENT:
+                cp437.debug_event('found Pablo sauce (variant)')
+            self.buffer = self.buffer[:-132]
+
+        # no idea what this is but okay
+        if self.has_trailer(201, '\x1a\x00\x00\x00COMNT'):
+            if cp437.DEBUG >= cp437.DEBUG_EVENT:
+                cp437.debug_event('found COMNT block')
+            self.buffer = self.buffer[:-201]
+
+        self.consume(0, len(self.buffer), True)
+        self.buffer = ''
+        self.offset = 0
+
+    def consume(self, tape_index, tape_eof, final):
+        # the tape is consumed a token at a time: either a run of printable bytes or an
+        # escape sequence. anything we can't make sense of after an escape gets an
+        # UnknownEvent and falls back to being printed, just like a real terminal would.
+        # escapes cut off by tape_eof are left alone unless this is the final chunk.
+        stream = self.buffer
+        screen = self.screen
+        print_event = self.get_event(PrintRunEvent, screen).__call__
+        print_bytes = PrintEvent in self.event_table and not PrintRunEvent in self.event_table
+
+        if print_bytes: # someone's overriding the printing of single bytes, so honor that
+            print_byte = self.get_event(PrintEvent, screen).__call__
+        unknown_event = self.get_event(UnknownEvent, screen).__call__
+
+        while tape_index < tape_eof:
+            token = PRINT_RUN.match(stream, tape_index, tape_eof)
+
+            if token is not None:
+                if cp437.DEBUG >= cp437.DEBUG_STATE:
+                    cp437.debug_state('tape index: {} / printing {} bytes', tape_index, token.end() - tape_index)
+
+                if print_bytes:
+                    for c in token.group():
+                        print_byte(ord(c))
+                else:
+                    print_event(token.group())
 
-        if sauce[:6] == '\x1aSAUCE':
-            cp437.debug_event('found Pablo sauce')
-            self.stream = self.stream[:-129]
+                tape_index = token.end()
+                continue
 
-        sauce = self.stream[-132:]
+            if cp437.DEBUG >= cp437.DEBUG_STATE:
+                cp437.debug_state('tape index: {} / found vt100 escape', tape_index)
 
-        if sauce[:9] == '\x1a\x00\x00\x00SAUCE':
-            cp437.debug_event('found Pablo sauce (variant)')
-            self.stream = self.stream[:-132]
+            if tape_index+1 == tape_eof:
+                return tape_index if not final else tape_eof
 
-        # no idea what this is but okay
-        comnt = self.stream[-201:]
+            if not stream[tape_index+1] == '[':
+                unknown_event()
+                tape_index += 1
+                continue
 
-        if comnt[:9] == '\x1a\x00\x00\x00COMNT':
-            cp437.debug_event('found COMNT block')
-            self.stream = self.stream[:-201]
+            sequence = self.match_sequence(tape_index+1, tape_eof)
 
-        states = ['print', 'esc', 'bracket', 'paren', 'pound', 'numeric', 'alpha', 'alnum']
+            if not final and self.is_partial(*sequence):
+                return tape_index
 
-        while tape_index < len(self.stream):
-            c = self.stream[tape_index]
+            tape_index = self.parse_sequence(screen, tape_index+1, *sequence)
 
-            cp437.debug_state('tape index: {} / state: {} / byte: {}'.format(tape_index
-                                                                       ,states[state]
-                                                                       ,ord(c)))
+        return tape_index
 
-            if state == print_state:
-                tape_index += 1
+    def match_sequence(self, peek_index, tape_eof):
+        # the CSI token and static match of the escape at peek_index, matched once and
+        # shared by is_partial and parse_sequence
+        return CSI_SEQUENCE.match(self.buffer, peek_index, tape_eof), self.match_static(peek_index, tape_eof)
 
-                if c == '\x1B':
-                    cp437.debug_state('found vt100 escape')
-                    state = esc_state
-                    continue
-                    
-                print_event = self.get_event(PrintEvent, screen)
-                print_event(ord(c))
-            elif state == esc_state:
-                peek_index = tape_index
-
-                if c == '[': # bracket state
-                    state = bracket_state
-                elif c == '(' or c == ')': # paren state
-                    state = paren_state
-                elif c == '#': # pound state
-                    state = pound_state
-                elif c in '0123456789':
-                    state = numeric_state
-                elif c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz':
-                    state = alpha_state
-                elif c in '<=>':
-                    state = alnum_state
-            elif state == bracket_state: # escape sequence starts with an open bracket
-                static_sequences = {
-                    '[7h': UnknownEvent,
-                    '[20h': UnknownEvent,
-                    '[?1h': UnknownEvent,
-                    '[?3h': UnknownEvent,
-                    '[?33h': UnknownEvent,
-                    '[?4h': UnknownEvent,
-                    '[?5h': UnknownEvent,
-                    '[?6h': UnknownEvent,
-                    '[?7h': UnknownEvent,
-                    '[?8h': UnknownEvent,
-                    '[?9h': UnknownEvent,
-                    '[20l': UnknownEvent,
-                    '[?1l': UnknownEvent,
-                    '[?2l': UnknownEvent,
-                    '[?3l': UnknownEvent,
-                    '[?4l': UnknownEvent,
-                    '[?5l': UnknownEvent,
-                    '[?6l': UnknownEvent,
-                    '[?7l': UnknownEvent,
-                    '[?8l': UnknownEvent,
-                    '[?9l': UnknownEvent,
-                    '[g': UnknownEvent,
-                    '[0g': UnknownEvent,
-                    '[3g': UnknownEvent,
-                    '[K': UnknownEvent,
-                    '[0K': UnknownEvent,
-                    '[1K': UnknownEvent,
-                    '[2K': UnknownEvent,
-                    '[J': UnknownEvent,
-                    '[0J': UnknownEvent,
-                    '[1J': UnknownEvent,
-                    '[2J': UnknownEvent,
-                    '[c': UnknownEvent,
-                    '[0c': UnknownEvent,
-                    '[2;1y': UnknownEvent,
-                    '[2;2y': UnknownEvent,
-                    '[2;9y': UnknownEvent,
-                    '[2;10y': UnknownEvent,
-                    '[0q': UnknownEvent,
-                    '[1q': UnknownEvent,
-                    '[2q': UnknownEvent,
-                    '[3q': UnknownEvent,
-                    '[4q': UnknownEvent}
-            
-                for i in xrange(6):
-                    sliced = self.stream[peek_index:peek_index+1+i]
-
-                    if sliced in static_sequences:
-                        cp437.debug_state('found sequence: {}'.format(sliced))
-
-                        event = self.get_event(static_sequences[sliced], screen)
-                        event()
-
-                        state = print_state
-                        tape_index = peek_index+1+i
-                        continue
-
-                stack = list()
-                numerics = list()
-                terminators = 'mrABCDHf'
-
-                peek_index += 1
-
-                if self.stream[peek_index:peek_index+3] == '?1;':
-                    peek_index += 3
-
-                while peek_index < tape_eof:
-                    c = self.stream[peek_index]
-                    peek_index += 1
-
-                    if c in '0123456789':
-                        stack.append(c)
-                    elif c == ';':
-                        s = ''.join(stack)
-                        n = int(s)
-                        stack = list()
-                        numerics.append(n)
-                    else:
-                        break
-
-                if not len(stack) == 0:
-                    s = ''.join(stack)
-                    n = int(s)
-                    stack = list()
-                    numerics.append(n)
-
-                state = print_state
-
-                cp437.debug_state('control codes: {} / command: {}', numerics, c)
-
-                if c == 'm':
-                    # do the things
-                    # TODO: convert these into events
-                    for n in numerics:
-                        if n >= 90 and n <= 97 or n >= 100 and n <= 107:
-                            cp437.debug_event('screen brightness triggered (high value)')
-                            screen.bright = True
-                            n -= 60
-
-                        if n == 0:
-                            cp437.debug_event('screen attributes reset')
-                            screen.reset_attributes()
-                        elif n == 1:
-                            cp437.debug_event('screen brightness triggered')
-                            screen.bright = True
-                        elif n == 2:
-                            cp437.debug_event('screen brightness removed')
-                            screen.bright = False
-                        elif n == 4:
-                            cp437.debug_event('underscore triggered')
-                            screen.underscore = True
-                        elif n == 5:
-                            cp437.debug_event('blink triggered')
-                            screen.blink = False
-                        elif n == 7:
-                            cp437.debug_event('screen reversal triggered')
-                            screen.reverse = True
-                        elif n == 8:
-                            cp437.debug_event('hidden blocks triggered')
-                            screen.hidden = True
-                        elif n >= 30 and n <= 37:
-                            cp437.debug_event('foreground: {}',n-30)
-                            screen.fg = ansi.vga[n]
-                        elif n >= 40 and n <= 47:
-                            cp437.debug_event('background: {}',n-40)
-                            screen.bg = ansi.vga[n]
-
-                    if len(numerics) == 0:
-                        screen.reset_attributes()
-
-                    tape_index = peek_index
-                elif c in 'ABCD':
-                    if len(numerics) == 0:
-                        event = self.get_event(UnknownEvent, screen)
-                        event()
-                        continue
-
-                    shift = numerics.pop(0)
-
-                    if not len(numerics) == 0:
-                        event = self.get_event(UnknownEvent, screen)
-                        event()
-                        continue
-
-                    event = self.get_event(CursorShiftEvent, screen)
-                    event(c, shift)
-                    tape_index = peek_index
-                else:
-                    cp437.debug_state('found terminator: {} (numerics: {})\n', c, numerics)
-                    event = self.get_event(UnknownEvent, screen)
-                    event()
-            else:
+    def is_partial(self, token, static):
+        # whether more data could still change what the escape turns out to be
+        if not token.group(3):
+            return True
+
+        return static[2]
+
+    def parse_sequence(self, screen, peek_index, token, static):
+        stream = self.buffer
+        static_event, tape_index = static[:2]
+
+        if static_event is not None:
+            if cp437.DEBUG >= cp437.DEBUG_STATE:
+                cp437.debug_state('found sequence: {}', stream[peek_index:tape_index])
+
+            event = self.get_event(static_event, screen)
+            event()
+
+        private, parameters, c = token.groups()
+        parameters = parameters.split(';')
+
+        if parameters[-1] == '':
+            parameters.pop()
+
+        # empty parameters like the first one of \x1b[;5m are the default, which is 0
+        numerics = [int(n) if n else 0 for n in parameters]
+
+        if cp437.DEBUG >= cp437.DEBUG_STATE:
+            cp437.debug_state('control codes: {} / command: {}', numerics, c)
+
+        if c == 'm':
+            self.select_graphic_rendition(screen, numerics)
+            return token.end()
+
+        if c and c in 'ABCD':
+            if not len(numerics) == 1:
                 event = self.get_event(UnknownEvent, screen)
                 event()
-                state = print_state
+                return tape_index
+
+            event = self.get_event(CursorShiftEvent, screen)
+            event(c, numerics[0])
+            return token.end()
+
+        if cp437.DEBUG >= cp437.DEBUG_STATE:
+            cp437.debug_state('found terminator: {} (numerics: {})', c, numerics)
+        event = self.get_event(UnknownEvent, screen)
+        event()
+
+        return tape_index
+
+    def select_graphic_rendition(self, screen, numerics):
+        # TODO: convert these into events
+        for n in numerics:
+            if n >= 90 and n <= 97 or n >= 100 and n <= 107:
+                if cp437.DEBUG >= cp437.DEBUG_EVENT:
+                    cp437.debug_event('screen brightness triggered (high value)')
+                screen.bright = True
+                n -= 60
+
+            if n == 0:
+                if cp437.DEBUG >= cp437.DEBUG_EVENT:
+                    cp437.debug_event('screen attributes reset')
+                screen.reset_attributes()
+            elif n == 1:
+                if cp437.DEBUG >= cp437.DEBUG_EVENT:
+                    cp437.debug_event('screen brightness triggered')
+                screen.bright = True
+            elif n == 2:
+                if cp437.DEBUG >= cp437.DEBUG_EVENT:
+                    cp437.debug_event('screen brightness removed')
+                screen.bright = False
+            elif n == 4:
+                if cp437.DEBUG >= cp437.DEBUG_EVENT:
+                    cp437.debug_event('underscore triggered')
+                screen.underscore = True
+            elif n == 5:
+                if cp437.DEBUG >= cp437.DEBUG_EVENT:
+                    cp437.debug_event('blink triggered')
+                screen.blink = False
+            elif n == 7:
+                if cp437.DEBUG >= cp437.DEBUG_EVENT:
+                    cp437.debug_event('screen reversal triggered')
+                screen.reverse = True
+            elif n == 8:
+                if cp437.DEBUG >= cp437.DEBUG_EVENT:
+                    cp437.debug_event('hidden blocks triggered')
+                screen.hidden = True
+            elif n >= 30 and n <= 37:
+                if cp437.DEBUG >= cp437.DEBUG_EVENT:
+                    cp437.debug_event('foreground: {}',n-30)
+                screen.fg = ansi.vga[n]
+            elif n >= 40 and n <= 47:
+                if cp437.DEBUG >= cp437.DEBUG_EVENT:
+                    cp437.debug_event('background: {}',n-40)
+                screen.bg = ansi.vga[n]
+
+        if len(numerics) == 0:
+            screen.reset_attributes()
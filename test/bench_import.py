@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+
+import os
+import subprocess
+import sys
+import time
+
+RUNS = 20
+
+def measure(statement):
+    timings = list()
+
+    for i in xrange(RUNS):
+        start = time.time()
+        subprocess.check_call([sys.executable, '-c', statement], cwd=os.path.dirname(os.path.abspath(__file__)))
+        timings.append(time.time() - start)
+
+    timings.sort()
+
+    return timings[len(timings)/2]
+
+if __name__ == '__main__':
+    baseline = measure('pass')
+    imported = measure('import cp437')
+    glyphs = measure('import cp437; cp437.ansi.charset.values()')
+
+    print 'interpreter startup: {:.1f}ms'.format(baseline*1000)
+    print 'import cp437:        {:.1f}ms (+{:.1f}ms)'.format(imported*1000, (imported-baseline)*1000)
+    print 'import + all glyphs: {:.1f}ms (+{:.1f}ms)'.format(glyphs*1000, (glyphs-baseline)*1000)
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+
+import os
+import StringIO
+import sys
+import time
+
+import cp437
+
+LEVELS = (1, 6, 9)
+RUNS = 5
+
+def measure(screen, **kwargs):
+    timings = list()
+
+    for i in xrange(RUNS):
+        output = StringIO.StringIO()
+        start = time.time()
+        screen.dump_png(output, **kwargs)
+        timings.append(time.time() - start)
+
+    timings.sort()
+
+    return timings[len(timings)/2], len(output.getvalue())
+
+if __name__ == '__main__':
+    filenames = sys.argv[1:] or [os.path.join(os.path.dirname(os.path.abspath(__file__)), 'joey.ans')]
+
+    for filename in filenames:
+        screen = cp437.vt100.VT100Screen()
+        cp437.vt100.VT100Parser(filename=filename).parse(screen)
+
+        print '{} ({} rows)'.format(os.path.basename(filename), screen.dY - screen.scroll)
+
+        for paletted in (True, False):
+            for level in LEVELS:
+                elapsed, size = measure(screen, paletted=paletted, compression=level)
+
+                print '  {} level {}: {:8.1f}ms {:9d} bytes'.format('paletted' if paletted else 'rgb     ', level, elapsed*1000, size)
+
+            elapsed, size = measure(screen, paletted=paletted, compression=1, strategy='rle')
+
+            print '  {} rle 1:   {:8.1f}ms {:9d} bytes'.format('paletted' if paletted else 'rgb     ', elapsed*1000, size)
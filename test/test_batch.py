@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from cp437 import batch
+
+class FindFilesTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+        for name in ('pack1', 'pack2'):
+            os.makedirs(os.path.join(self.directory, name, 'sub'))
+
+            for filename in ('file.ans', os.path.join('sub', 'file.ans'), 'skipped.png'):
+                fp = open(os.path.join(self.directory, name, filename), 'wb')
+                fp.write('\x1b[1;31m' + name + '\x1b[0m\r\n')
+                fp.close()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def path(self, *names):
+        return os.path.join(self.directory, *names)
+
+    def test_directories_share_relative_path(self):
+        files = list(batch.find_files([self.path('pack1'), self.path('pack2')]))
+
+        self.assertEqual(sorted([name for filename, name in files]),
+                         [os.path.join('pack1', 'file.ans'), os.path.join('pack1', 'sub', 'file.ans'),
+                          os.path.join('pack2', 'file.ans'), os.path.join('pack2', 'sub', 'file.ans')])
+
+    def test_files_share_name(self):
+        files = list(batch.find_files([self.path('pack1', 'file.ans'), self.path('pack2', 'file.ans')]))
+
+        self.assertEqual([name for filename, name in files],
+                         [os.path.join('pack1', 'file.ans'), os.path.join('pack2', 'file.ans')])
+
+    def test_single_directory(self):
+        files = list(batch.find_files([self.path('pack1')]))
+
+        self.assertEqual([name for filename, name in files],
+                         [os.path.join('pack1', 'file.ans'), os.path.join('pack1', 'sub', 'file.ans')])
+
+    def test_run_keeps_directories_apart(self):
+        output_dir = self.path('output')
+        files = list(batch.find_files([self.path('pack1'), self.path('pack2')]))
+        results = list(batch.run(files, output_dir, {'text': True}, workers=1))
+
+        self.assertEqual([result.error for result in results], [None]*4)
+
+        for name in ('pack1', 'pack2'):
+            fp = open(os.path.join(output_dir, name, 'file.ans.txt'), 'rb')
+            self.assertIn(name, fp.read())
+            fp.close()
+
+if __name__ == '__main__':
+    unittest.main()
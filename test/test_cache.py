@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from cp437 import batch, cache, vt100
+
+def lines(count):
+    return '\r\n'.join(['\x1b[1;3{}mline {}'.format(i % 8, i) for i in xrange(count)])
+
+def parsed(data, **kwargs):
+    screen = vt100.VT100Screen(**kwargs)
+    vt100.VT100Parser(stream=data).parse(screen)
+
+    return screen
+
+def files(directory):
+    return sorted([os.path.relpath(os.path.join(root, filename), directory)
+                   for root, dirs, filenames in os.walk(directory) for filename in filenames])
+
+class RenderCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.renders = list()
+
+    def tearDown(self):
+        cache.render_caches.pop(os.path.abspath(self.directory), None)
+        shutil.rmtree(self.directory)
+
+    def render_with(self, data):
+        def render(fp):
+            self.renders.append(data)
+            fp.write(data.upper())
+
+        return render
+
+    def test_key_stability(self):
+        # options that don't change the output, or are just the defaults, don't change the key
+        render_cache = cache.RenderCache(self.directory)
+        options = batch.output_options({})
+
+        self.assertEqual(batch.output_options({'compression': None, 'strategy': None, 'workers': 4, 'cache_dir': 'elsewhere'}), options)
+        self.assertEqual(render_cache.key('data', batch.output_options({'nfo': 0, 'spacing': 1})), render_cache.key('data', options))
+        self.assertEqual(batch.output_options({'text': True, 'spacing': False}), batch.output_options({'text': True}))
+
+        self.assertNotEqual(render_cache.key('data', batch.output_options({'width': 132})), render_cache.key('data', options))
+        self.assertNotEqual(render_cache.key('data', batch.output_options({'compression': 1})), render_cache.key('data', options))
+        self.assertNotEqual(render_cache.key('other', options), render_cache.key('data', options))
+
+    def test_round_trip(self):
+        render_cache = cache.RenderCache(self.directory)
+
+        self.assertEqual(render_cache.render('art', {}, '.txt', self.render_with('art')), 'ART')
+        self.assertEqual(render_cache.render('art', {}, '.txt', self.render_with('art')), 'ART')
+        self.assertEqual(self.renders, ['art'])
+
+        # a different extension or different options are rendered again
+        render_cache.render('art', {}, '.png', self.render_with('art'))
+        render_cache.render('art', {'width': 132}, '.txt', self.render_with('art'))
+
+        self.assertEqual(self.renders, ['art']*3)
+        self.assertEqual(len(list(render_cache.entries())), 3)
+
+    def test_eviction(self):
+        render_cache = cache.RenderCache(self.directory, size=250)
+        keys = ['first', 'second', 'third']
+
+        for i, key in enumerate(keys[:2]):
+            render_cache.put(key, '.txt', 'x'*100)
+            os.utime(render_cache.path(key, '.txt'), (time.time()-100+i, time.time()-100+i))
+
+        # reading the oldest makes it the most recently used
+        self.assertEqual(render_cache.get('first', '.txt'), 'x'*100)
+
+        render_cache.put('third', '.txt', 'x'*100)
+
+        self.assertEqual([render_cache.get(key, '.txt') is None for key in keys], [False, True, False])
+        self.assertEqual(render_cache.used, 200)
+
+    def test_render_raises(self):
+        render_cache = cache.RenderCache(self.directory)
+
+        def render(fp):
+            fp.write('half')
+            raise RuntimeError('render failed')
+
+        self.assertRaises(RuntimeError, render_cache.render, 'art', {}, '.txt', render)
+        self.assertEqual(files(self.directory), [])
+
+        output = os.path.join(self.directory, 'output.txt')
+
+        self.assertRaises(RuntimeError, cache.write_atomically, output, render)
+        self.assertEqual(files(self.directory), [])
+
+    def test_write_atomically(self):
+        output = os.path.join(self.directory, 'output.txt')
+
+        cache.write_atomically(output, lambda fp: fp.write('first'))
+        cache.write_atomically(output, lambda fp: fp.write('second'))
+
+        self.assertEqual(open(output, 'rb').read(), 'second')
+        self.assertEqual(files(self.directory), ['output.txt'])
+
+    def test_one_per_directory(self):
+        render_cache = cache.get_render_cache(self.directory)
+
+        self.assertIs(cache.get_render_cache(self.directory + os.sep), render_cache)
+        self.assertIs(cache.get_render_cache(os.path.join(self.directory, 'shard', os.pardir)), render_cache)
+        self.assertIsNot(cache.get_render_cache(os.path.join(self.directory, 'other')), render_cache)
+
+        cache.render_caches.pop(os.path.abspath(os.path.join(self.directory, 'other')))
+
+class ScreenCacheTest(unittest.TestCase):
+    def test_palettes(self):
+        screen_cache = cache.ScreenCache()
+        data = lines(20)
+        colors = dict([(i, (i, i, i)) for i in xrange(16)])
+
+        screen_cache.get(data)
+        screen_cache.get(data, palette=vt100.VT100Palette(dict(), nfo=True))
+        screen_cache.get(data, palette=vt100.VT100Palette(dict(colors)))
+        colors[1] = (255, 0, 0)
+        screen_cache.get(data, palette=vt100.VT100Palette(dict(colors)))
+
+        self.assertEqual(len(screen_cache), 4)
+
+        # the same colors in a new palette object are the same entry
+        screen = screen_cache.get(data, palette=vt100.VT100Palette(dict(colors)))
+
+        self.assertEqual(len(screen_cache), 4)
+        self.assertEqual(tuple(screen.palette.get(1)), (255, 0, 0))
+        self.assertTrue(screen_cache.get(data, palette=vt100.VT100Palette(dict(), nfo=True)).palette.nfo)
+
+    def test_height_and_spacing(self):
+        screen_cache = cache.ScreenCache()
+        data = lines(20)
+        first = screen_cache.get(data, height=10, spacing=False)
+        second = screen_cache.get(data, height=30)
+
+        self.assertEqual(len(screen_cache), 1)
+        self.assertEqual((first.height, first.spacing), (10, 8))
+        self.assertEqual((second.height, second.spacing), (30, 9))
+        self.assertIs(first.drawbuffer, second.drawbuffer)
+        self.assertEqual(first.dump_str(), parsed(data).dump_str())
+
+    def test_eviction(self):
+        size = parsed(lines(20)).memory_size()
+        screen_cache = cache.ScreenCache(size=size*3/2)
+
+        screen_cache.get(lines(20))
+        screen_cache.get(lines(20) + 'more')
+
+        self.assertEqual(len(screen_cache), 1)
+        self.assertTrue(screen_cache.used <= screen_cache.size)
+
+        # the most recently used one stays
+        screen_cache.get(lines(20) + 'more')
+        self.assertEqual(len(screen_cache), 1)
+
+    def test_oversized(self):
+        screen_cache = cache.ScreenCache(size=1)
+        screen = screen_cache.get(lines(20))
+
+        self.assertEqual(len(screen_cache), 0)
+        self.assertEqual(screen_cache.used, 0)
+        self.assertEqual(screen.dump_str(), parsed(lines(20)).dump_str())
+
+    def test_memory_size(self):
+        empty = vt100.VT100Screen().memory_size()
+        short = parsed(lines(10)).memory_size()
+        tall = parsed(lines(100)).memory_size()
+
+        self.assertTrue(empty < short < tall)
+
+        # only what's still in the line buffer counts
+        self.assertTrue(parsed(lines(100), linebuffer=10).memory_size() < tall)
+
+if __name__ == '__main__':
+    unittest.main()
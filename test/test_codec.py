@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+
+import unittest
+
+import cp437
+
+class CodecTest(unittest.TestCase):
+    def test_round_trip(self):
+        data = ''.join(map(chr, xrange(256)))
+
+        self.assertEqual(data.decode('cp437-art').encode('cp437-art'), data)
+        self.assertEqual(data.decode('cp437_art')[1], u'\u263a')
+
+    def test_strict(self):
+        self.assertRaises(UnicodeEncodeError, u'\u2603'.encode, 'cp437-art')
+
+    def test_best_effort(self):
+        self.assertEqual(u'caf\xe9\n'.encode('cp437-art', 'best-effort'), 'caf\x82\n')
+        self.assertEqual(u'\u0101'.encode('cp437-art', 'best-effort'), 'a')
+        self.assertEqual(u'\u2603'.encode('cp437-art', 'cp437-art-best-effort'), '?')
+
+if __name__ == '__main__':
+    unittest.main()
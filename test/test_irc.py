@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+
+import unittest
+
+from cp437 import irc
+
+class IRCTranslatorTest(unittest.TestCase):
+    def test_codes(self):
+        self.assertEqual(irc.translate('\x034,2x'), '\x1b[1;30;44mx')
+        self.assertEqual(irc.translate('\x033x'), '\x1b[0;32;40mx')
+        self.assertEqual(irc.translate('\x034,2\x03x'), '\x1b[1;30;44m\x1b[0;37;40mx')
+        self.assertEqual(irc.translate('\x02x\x0fy'), '\x1b[1;37;40mx\x1b[0my')
+        self.assertEqual(irc.translate('\x033\x16x'), '\x1b[0;32;40m\x1b[0;30;42mx')
+
+    def test_longest_code(self):
+        # \x031,1 is a prefix of \x031,12 and mustn't be translated as one
+        self.assertEqual(irc.translate('\x031,12x'), '\x1b[0;30;44mx')
+
+    def test_chunked(self):
+        data = ''.join(['ab', '\x02', '\x0f', '\x16', '\x03', '\x034', '\x03,', '\x0399,1', '\x0312,',
+                        '\x0342', '\x031,2x', '\x03123', '\x0314,15text', 'plain']*20)
+        whole = irc.translate(data)
+
+        for chunk_size in xrange(1, 12):
+            translator = irc.IRCTranslator()
+            chunks = [translator.feed(data[i:i+chunk_size]) for i in xrange(0, len(data), chunk_size)]
+
+            self.assertEqual(''.join(chunks) + translator.close(), whole, 'chunks of {} bytes'.format(chunk_size))
+
+if __name__ == '__main__':
+    unittest.main()
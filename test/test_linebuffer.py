@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+
+import unittest
+
+from cp437 import vt100
+
+class LineBufferTest(unittest.TestCase):
+    def test_scroll(self):
+        rows = vt100.VT100LineBuffer(4)
+
+        for i in xrange(6):
+            rows.scroll_to(i-3)
+            rows[i] = i
+
+        self.assertEqual([rows.get(i) for i in xrange(6)], [None, None, 2, 3, 4, 5])
+        self.assertNotIn(1, rows)
+        self.assertRaises(KeyError, rows.__getitem__, 1)
+        self.assertRaises(IndexError, rows.__setitem__, 6, 6)
+
+    def test_overflow(self):
+        # only the rows still in the line buffer are dumped
+        screen = vt100.VT100Screen(linebuffer=4)
+        vt100.VT100Parser(stream='\r\n'.join(['line{}'.format(i) for i in xrange(10)])).parse(screen)
+        lines = screen.dump_str(colors=False, utf8=False).split('\n')
+
+        self.assertEqual([line.rstrip() for line in lines if line], ['line6', 'line7', 'line8', 'line9'])
+
+if __name__ == '__main__':
+    unittest.main()
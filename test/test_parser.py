@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+import unittest
+
+from cp437 import vt100
+
+CHUNK_SIZES = (1, 2, 3, 5, 7, 64, 461, 462, 463, 4096)
+
+def parse(data, chunk_size=None):
+    screen = vt100.VT100Screen()
+    parser = vt100.VT100Parser(screen=screen)
+
+    if chunk_size is None:
+        parser.feed(data)
+    else:
+        for i in xrange(0, len(data), chunk_size):
+            parser.feed(data[i:i+chunk_size])
+
+    parser.close()
+
+    return screen.dump_str(colors=True, utf8=True)
+
+def sauce(marker='\x1aSAUCE', size=129):
+    return marker + 'S'*(size-len(marker))
+
+class FeedTest(unittest.TestCase):
+    def assertChunked(self, data):
+        whole = parse(data)
+
+        for chunk_size in CHUNK_SIZES:
+            self.assertEqual(parse(data, chunk_size), whole, 'chunks of {} bytes'.format(chunk_size))
+
+    def test_art(self):
+        self.assertChunked(open('joey.ans', 'rb').read())
+
+    def test_partial_sequences(self):
+        # CSI sequences, static sequences and their prefixes cut at every offset
+        self.assertChunked('\x1b[1;31mred\x1b[0m\x1b[2Jclear\x1b[?7hwrap\x1b[2;10ysome\x1b[20lmore\x1b[5Cright')
+
+    def test_trailers(self):
+        art = open('joey.ans', 'rb').read()
+
+        self.assertChunked(art + sauce())
+        self.assertChunked(art + sauce('\x1a\x00\x00\x00SAUCE', 132))
+        self.assertChunked(art + sauce('\x1a\x00\x00\x00COMNT', 201) + sauce())
+
+class TrailerTest(unittest.TestCase):
+    def test_stripped(self):
+        self.assertEqual(parse('art' + sauce()), parse('art'))
+        self.assertEqual(parse('art' + sauce('\x1a\x00\x00\x00COMNT', 201) + sauce()), parse('art'))
+
+    def test_short_marker_kept(self):
+        # a SAUCE marker that isn't a whole trailer is art like anything else
+        for chunk_size in (None,) + CHUNK_SIZES:
+            self.assertEqual(parse('ab\x1aSAUCEcd', chunk_size), parse('ab\x1aSAUCEcd'))
+            self.assertIn(u'cd', parse('ab\x1aSAUCEcd', chunk_size))
+
+class SequenceTest(unittest.TestCase):
+    def test_empty_parameters(self):
+        self.assertEqual(parse('\x1b[;31mx'), parse('\x1b[0;31mx'))
+        self.assertEqual(parse('\x1b[1;;31mx'), parse('\x1b[1;0;31mx'))
+
+class Unseekable(object):
+    def __init__(self, data):
+        self.data = data
+
+    def read(self, size):
+        data, self.data = self.data[:size], self.data[size:]
+
+        return data
+
+class ParseTest(unittest.TestCase):
+    def parse_twice(self, parser):
+        dumps = list()
+
+        for i in xrange(2):
+            screen = vt100.VT100Screen()
+            parser.parse(screen)
+            dumps.append((screen.dY, screen.dump_str(colors=True, utf8=True)))
+
+        return dumps
+
+    def test_filename_twice(self):
+        first, second = self.parse_twice(vt100.VT100Parser(filename='joey.ans'))
+
+        self.assertEqual(first, second)
+        self.assertEqual(first[1], parse(open('joey.ans', 'rb').read()))
+
+    def test_file_twice(self):
+        fp = open('joey.ans', 'rb')
+
+        try:
+            first, second = self.parse_twice(vt100.VT100Parser(file=fp))
+        finally:
+            fp.close()
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first[0], 0)
+
+    def test_unseekable_file_twice(self):
+        parser = vt100.VT100Parser(file=Unseekable(open('joey.ans', 'rb').read()))
+        parser.parse(vt100.VT100Screen())
+
+        self.assertRaises(ValueError, parser.parse, vt100.VT100Screen())
+
+    def test_closed_file(self):
+        fp = open('joey.ans', 'rb')
+        parser = vt100.VT100Parser(file=fp)
+        fp.close()
+
+        self.assertRaises(ValueError, parser.parse, vt100.VT100Screen())
+
+    def test_nothing_to_parse(self):
+        self.assertRaises(ValueError, vt100.VT100Parser)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+
+import os
+import StringIO
+import struct
+import threading
+import unittest
+import zlib
+
+from cp437 import raster, vt100
+
+def tall_art(rows):
+    # every color on every background, a few times more rows than a band
+    lines = ['\x1b[{};3{};4{}m{:03d} '.format(row & 1, row % 8, (row // 8) % 8, row) + chr(0xb0 + row % 3)*70
+             for row in xrange(rows)]
+
+    return '\r\n'.join(lines)
+
+def read_png(data):
+    # the image data and the chunks it isn't in, checking each chunk's CRC on the way
+    chunks = list()
+    idat = list()
+    offset = 8
+
+    while offset < len(data):
+        length, name = struct.unpack('>I4s', data[offset:offset+8])
+        body = data[offset+8:offset+8+length]
+        crc, = struct.unpack('>I', data[offset+8+length:offset+12+length])
+        assert crc == zlib.crc32(name + body) & 0xFFFFFFFF, 'bad CRC for ' + name
+        offset += length + 12
+
+        if name == 'IDAT':
+            idat.append(body)
+        else:
+            chunks.append((name, body))
+
+    # decompress checks the adler32 at the end of the stream
+    return zlib.decompress(''.join(idat)), chunks
+
+class ParallelTest(unittest.TestCase):
+    ROWS = raster.PARALLEL_BAND_ROWS*2 + 5
+
+    def dump(self, screen, **kwargs):
+        fp = StringIO.StringIO()
+        screen.dump_png(fp, **kwargs)
+
+        return read_png(fp.getvalue())
+
+    def assertParallel(self, screen, paletted):
+        serial = self.dump(screen, paletted=paletted)
+        parallel = self.dump(screen, paletted=paletted, workers=2)
+
+        self.assertEqual(len(serial[0]), len(parallel[0]))
+        self.assertTrue(serial[0] == parallel[0], 'pixels differ')
+        self.assertEqual(serial[1], parallel[1])
+
+    def parse(self, **kwargs):
+        screen = vt100.VT100Screen(**kwargs)
+        vt100.VT100Parser(stream=tall_art(self.ROWS)).parse(screen)
+
+        self.assertTrue(screen.dY > raster.PARALLEL_BAND_ROWS)
+
+        return screen
+
+    def test_rgb(self):
+        self.assertParallel(self.parse(), False)
+
+    def test_4bit(self):
+        self.assertParallel(self.parse(), True)
+
+    def test_1bit(self):
+        self.assertParallel(self.parse(palette=vt100.VT100Palette(dict(), nfo=True)), True)
+
+class GlyphCacheTest(unittest.TestCase):
+    def test_threads(self):
+        # a cache too small for the art, so threads keep evicting each other's glyphs
+        glyph_cache = raster.GlyphCache(size=16)
+        screen = vt100.VT100Screen()
+        vt100.VT100Parser(stream=tall_art(40)).parse(screen)
+        expected = [raster.render_row(screen, row, raster.get_palette(screen), raster.GlyphCache()) for row in xrange(screen.dY)]
+        results = list()
+
+        def render():
+            results.append([raster.render_row(screen, row, raster.get_palette(screen), glyph_cache) for row in xrange(screen.dY)])
+
+        threads = [threading.Thread(target=render) for i in xrange(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all([result == expected for result in results]))
+        self.assertTrue(len(glyph_cache.strips) <= glyph_cache.size)
+
+class Adler32Test(unittest.TestCase):
+    def test_combine(self):
+        first = os.urandom(70000)
+
+        for second in ('', 'x', os.urandom(65521), os.urandom(200000)):
+            self.assertEqual(raster.adler32_combine(zlib.adler32(first) & 0xFFFFFFFF, zlib.adler32(second) & 0xFFFFFFFF, len(second)),
+                             zlib.adler32(first + second) & 0xFFFFFFFF)
+
+    def test_empty_first(self):
+        self.assertEqual(raster.adler32_combine(1, zlib.adler32('data') & 0xFFFFFFFF, 4), zlib.adler32('data') & 0xFFFFFFFF)
+
+if __name__ == '__main__':
+    unittest.main()